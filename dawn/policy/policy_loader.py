@@ -10,11 +10,15 @@ Responsibilities:
 - Fail fast on invalid/missing policy
 """
 
+import copy
+import os
 import yaml
 import hashlib
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+from ..runtime.fileio import read_bytes
 
 
 class PolicyValidationError(Exception):
@@ -22,14 +26,47 @@ class PolicyValidationError(Exception):
     pass
 
 
+class _CanonicalEncoder(json.JSONEncoder):
+    """
+    Compact, key-sorted, ASCII-only JSON encoder used for policy digests.
+
+    iterencode() output is byte-identical to
+    json.dumps(obj, sort_keys=True, separators=(',', ':')), so digests are
+    unchanged while the full serialized string is never materialized.
+    """
+
+    def __init__(self):
+        super().__init__(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+_CANONICAL_ENCODER = _CanonicalEncoder()
+
+
+# Parsed policy cache: path -> ((st_mtime_ns, st_size), policy, digest, raw_yaml).
+# Keyed on the file's stat signature so an edited policy is never served stale.
+_POLICY_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any], str, str]] = {}
+
+
 class PolicyLoader:
     """Loads, validates, and provides access to DAWN runtime policy."""
 
-    REQUIRED_KEYS = ["version", "budgets", "security", "profiles", "default_profile"]
-    REQUIRED_BUDGET_SECTIONS = ["per_link", "per_project"]
-    REQUIRED_PER_LINK_KEYS = ["max_wall_time_sec", "max_output_bytes"]
-    REQUIRED_PER_PROJECT_KEYS = ["max_project_bytes"]
-    REQUIRED_PROFILE_KEYS = ["allow_src_writes", "artifact_only_outputs"]
+    __slots__ = (
+        "policy_path", "_policy", "_digest", "_raw_yaml", "_signature",
+        "_budgets", "_security", "_profiles", "_retry", "_retention",
+    )
+
+    REQUIRED_KEYS = frozenset({"version", "budgets", "security", "profiles", "default_profile"})
+    REQUIRED_BUDGET_SECTIONS = frozenset({"per_link", "per_project"})
+    REQUIRED_PER_LINK_KEYS = frozenset({"max_wall_time_sec", "max_output_bytes"})
+    REQUIRED_PER_PROJECT_KEYS = frozenset({"max_project_bytes"})
+    REQUIRED_PROFILE_KEYS = frozenset({"allow_src_writes", "artifact_only_outputs"})
+
+    # Artifact types protected from retention when the policy does not list any
+    _DEFAULT_PROTECTED = (
+        "dawn.evidence.pack",
+        "dawn.release.bundle",
+        "dawn.metrics.run_summary",
+    )
 
     def __init__(self, policy_path: Optional[Path] = None):
         if policy_path is None:
@@ -39,14 +76,35 @@ class PolicyLoader:
         self._policy: Optional[Dict[str, Any]] = None
         self._digest: Optional[str] = None
         self._raw_yaml: Optional[str] = None
+        self._signature: Optional[Tuple[int, int]] = None
+
+        # Top-level sections, bound once per load() for the hot accessors
+        self._budgets: Dict[str, Any] = {}
+        self._security: Dict[str, Any] = {}
+        self._profiles: Dict[str, Any] = {}
+        self._retry: Dict[str, Any] = {}
+        self._retention: Dict[str, Any] = {}
 
     def load(self) -> Dict[str, Any]:
         """Load and validate the policy file. Raises PolicyValidationError on failure."""
-        if not self.policy_path.exists():
+        try:
+            st = os.stat(self.policy_path)
+        except FileNotFoundError:
             raise PolicyValidationError(f"Policy file not found: {self.policy_path}")
 
+        cache_key = str(self.policy_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _POLICY_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            # Hand out a private copy: callers may mutate the policy in place
+            _, policy, self._digest, self._raw_yaml = cached
+            self._policy = copy.deepcopy(policy)
+            self._signature = signature
+            self._bind_sections()
+            return self._policy
+
         try:
-            self._raw_yaml = self.policy_path.read_text()
+            self._raw_yaml = read_bytes(self.policy_path).decode()
             self._policy = yaml.safe_load(self._raw_yaml)
         except yaml.YAMLError as e:
             raise PolicyValidationError(f"Invalid YAML in policy file: {e}")
@@ -56,33 +114,59 @@ class PolicyLoader:
 
         self._validate()
         self._compute_digest()
+        self._signature = signature
+        self._bind_sections()
 
+        _POLICY_CACHE[cache_key] = (
+            signature, copy.deepcopy(self._policy), self._digest, self._raw_yaml
+        )
         return self._policy
 
+    def is_stale(self) -> bool:
+        """True if the policy file changed (or vanished) since it was loaded."""
+        try:
+            st = os.stat(self.policy_path)
+        except OSError:
+            return True
+        return self._signature != (st.st_mtime_ns, st.st_size)
+
+    def _bind_sections(self):
+        """Pre-extract top-level sections so accessors skip nested lookups."""
+        policy = self._policy
+        self._budgets = policy.get("budgets") or {}
+        self._security = policy.get("security") or {}
+        self._profiles = policy.get("profiles") or {}
+        self._retry = policy.get("retry") or {}
+        self._retention = policy.get("retention") or {}
+
     def _validate(self):
         """Validate required keys and structure."""
         # Check top-level required keys
-        for key in self.REQUIRED_KEYS:
-            if key not in self._policy:
-                raise PolicyValidationError(f"Missing required key: {key}")
+        missing = self.REQUIRED_KEYS - self._policy.keys()
+        if missing:
+            raise PolicyValidationError(f"Missing required keys: {sorted(missing)}")
 
         # Validate budgets structure
         budgets = self._policy.get("budgets", {})
-        for section in self.REQUIRED_BUDGET_SECTIONS:
-            if section not in budgets:
-                raise PolicyValidationError(f"Missing required budget section: budgets.{section}")
+        missing = self.REQUIRED_BUDGET_SECTIONS - budgets.keys()
+        if missing:
+            raise PolicyValidationError(
+                f"Missing required budget sections: {sorted('budgets.' + k for k in missing)}"
+            )
 
         # Validate per_link budget keys
-        per_link = budgets.get("per_link", {})
-        for key in self.REQUIRED_PER_LINK_KEYS:
-            if key not in per_link:
-                raise PolicyValidationError(f"Missing required budget key: budgets.per_link.{key}")
+        missing = self.REQUIRED_PER_LINK_KEYS - budgets["per_link"].keys()
+        if missing:
+            raise PolicyValidationError(
+                f"Missing required budget keys: {sorted('budgets.per_link.' + k for k in missing)}"
+            )
 
         # Validate per_project budget keys
-        per_project = budgets.get("per_project", {})
-        for key in self.REQUIRED_PER_PROJECT_KEYS:
-            if key not in per_project:
-                raise PolicyValidationError(f"Missing required budget key: budgets.per_project.{key}")
+        missing = self.REQUIRED_PER_PROJECT_KEYS - budgets["per_project"].keys()
+        if missing:
+            raise PolicyValidationError(
+                f"Missing required budget keys: {sorted('budgets.per_project.' + k for k in missing)}"
+            )
 
         # Validate profiles exist and have required keys
         profiles = self._policy.get("profiles", {})
@@ -92,11 +176,11 @@ class PolicyLoader:
             raise PolicyValidationError(f"default_profile '{default_profile}' not found in profiles")
 
         for profile_name, profile_config in profiles.items():
-            for key in self.REQUIRED_PROFILE_KEYS:
-                if key not in profile_config:
-                    raise PolicyValidationError(
-                        f"Missing required key in profile '{profile_name}': {key}"
-                    )
+            missing = self.REQUIRED_PROFILE_KEYS - profile_config.keys()
+            if missing:
+                raise PolicyValidationError(
+                    f"Missing required keys in profile '{profile_name}': {sorted(missing)}"
+                )
 
         # Validate version is 2.x (reject old 1.x schema)
         version = self._policy.get("version", "")
@@ -115,9 +199,11 @@ class PolicyLoader:
 
     def _compute_digest(self):
         """Compute SHA256 digest of normalized policy for idempotency signatures."""
-        # Normalize by serializing to sorted JSON (deterministic)
-        normalized = json.dumps(self._policy, sort_keys=True, separators=(',', ':'))
-        self._digest = hashlib.sha256(normalized.encode()).hexdigest()
+        # Normalize by feeding sorted, compact JSON to the hasher (deterministic)
+        h = hashlib.sha256()
+        for chunk in _CANONICAL_ENCODER.iterencode(self._policy):
+            h.update(chunk.encode("ascii"))  # ensure_ascii guarantees ASCII
+        self._digest = h.hexdigest()
 
     @property
     def policy(self) -> Dict[str, Any]:
@@ -140,25 +226,28 @@ class PolicyLoader:
 
     def get_profile(self, profile_name: Optional[str] = None) -> Dict[str, Any]:
         """Get a specific profile config, or default if not specified."""
+        if self._policy is None:
+            raise RuntimeError("Policy not loaded. Call load() first.")
         if profile_name is None:
             profile_name = self.policy.get("default_profile", "normal")
 
-        profiles = self.policy.get("profiles", {})
-        if profile_name not in profiles:
+        try:
+            return self._profiles[profile_name]
+        except KeyError:
             raise PolicyValidationError(f"Profile '{profile_name}' not found")
 
-        return profiles[profile_name]
-
     def get_budget(self, scope: str, key: str) -> Any:
         """Get a budget value. scope is 'per_link', 'per_pipeline', or 'per_project'."""
-        budgets = self.policy.get("budgets", {})
-        scope_budgets = budgets.get(scope, {})
-        return scope_budgets.get(key)
+        if self._policy is None:
+            raise RuntimeError("Policy not loaded. Call load() first.")
+        scope_budgets = self._budgets.get(scope)
+        return scope_budgets.get(key) if scope_budgets else None
 
     def get_security(self, key: str) -> Any:
         """Get a security setting."""
-        security = self.policy.get("security", {})
-        return security.get(key)
+        if self._policy is None:
+            raise RuntimeError("Policy not loaded. Call load() first.")
+        return self._security.get(key)
 
     def is_src_write_allowed(self, link_id: str, profile_name: Optional[str] = None) -> bool:
         """Check if a link is allowed to write to src/ under the given profile."""
@@ -196,7 +285,9 @@ class PolicyLoader:
 
     def get_retry_config(self) -> Dict[str, Any]:
         """Get the retry configuration."""
-        return self.policy.get("retry", {})
+        if self._policy is None:
+            raise RuntimeError("Policy not loaded. Call load() first.")
+        return self._retry
 
     def get_max_retries_per_link(self) -> int:
         """Get maximum retries per link."""
@@ -237,7 +328,9 @@ class PolicyLoader:
 
     def get_retention_config(self) -> Dict[str, Any]:
         """Get the retention configuration."""
-        return self.policy.get("retention", {})
+        if self._policy is None:
+            raise RuntimeError("Policy not loaded. Call load() first.")
+        return self._retention
 
     def get_keep_last_n_runs(self) -> int:
         """Get number of successful runs to keep per project."""
@@ -251,13 +344,11 @@ class PolicyLoader:
         """Get number of days to keep failed runs."""
         return self.get_retention_config().get("keep_failed_runs_days", 7)
 
-    def get_protected_artifacts(self) -> list:
-        """Get list of artifact types that should never be deleted."""
-        return self.get_retention_config().get("protected_artifacts", [
-            "dawn.evidence.pack",
-            "dawn.release.bundle",
-            "dawn.metrics.run_summary"
-        ])
+    def get_protected_artifacts(self) -> Sequence[str]:
+        """Get artifact types that should never be deleted."""
+        if self._policy is None:
+            raise RuntimeError("Policy not loaded. Call load() first.")
+        return self._retention.get("protected_artifacts", self._DEFAULT_PROTECTED)
 
     def should_preserve_ledger(self) -> bool:
         """Check if ledger should be preserved (never deleted)."""
@@ -269,7 +360,7 @@ class PolicyLoader:
             "version": self.version,
             "digest": self.digest,
             "default_profile": self.policy.get("default_profile"),
-            "budgets": self.policy.get("budgets", {}),
+            "budgets": self._budgets,
             "retry": self.get_retry_config(),
             "retention": self.get_retention_config(),
         }
@@ -283,17 +374,23 @@ def get_policy_loader(policy_path: Optional[Path] = None) -> PolicyLoader:
     """Get the policy loader singleton, creating and loading if needed."""
     global _default_loader
 
-    if _default_loader is None or policy_path is not None:
-        loader = PolicyLoader(policy_path)
+    if policy_path is not None:
+        # A fresh loader per call: load() is served from _POLICY_CACHE while
+        # the file is unchanged, and each caller gets its own policy copy
+        loader = PolicyLoader(Path(policy_path).resolve())
         loader.load()
-        if policy_path is None:
-            _default_loader = loader
         return loader
 
+    if _default_loader is None:
+        loader = PolicyLoader()
+        loader.load()
+        _default_loader = loader
+
     return _default_loader
 
 
 def reset_policy_loader():
-    """Reset the singleton (for testing)."""
+    """Reset the singleton and the policy caches (for testing)."""
     global _default_loader
     _default_loader = None
+    _POLICY_CACHE.clear()
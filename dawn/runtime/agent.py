@@ -7,57 +7,98 @@ import yaml
 from pathlib import Path
 from dawn.runtime.orchestrator import Orchestrator
 from dawn.runtime.ledger import Ledger
+from dawn.runtime.fileio import json_loads, read_bytes
 
-def get_project_status(project_id, projects_dir, links_dir):
-    """Get project status."""
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Ledger statuses that determine a link's reported state
+_TRACKED_STATUSES = frozenset({"STARTED", "SUCCEEDED", "FAILED", "SKIPPED"})
+
+# Parsed pipeline cache: abs path -> ((st_mtime_ns, st_size), pipeline)
+_PIPELINE_CACHE = {}
+
+def _load_pipeline(path):
+    """
+    Parse a pipeline YAML file, memoized on its stat signature.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _PIPELINE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    pipeline = yaml.load(read_bytes(path), Loader=_YamlLoader)
+    _PIPELINE_CACHE[key] = (signature, pipeline)
+    return pipeline
+
+def _load_index(project_root):
+    """Load a project's artifact_index.json, or an empty index if absent."""
+    try:
+        return json_loads(read_bytes(Path(project_root) / "artifact_index.json"))
+    except FileNotFoundError:
+        return {}
+
+def _infer_pipeline_id(project_root, events):
+    """Pipeline ID from the latest ledger event carrying one, else project metadata."""
+    pipeline_id = next((e.get("pipeline_id") for e in reversed(events) if e.get("pipeline_id")), None)
+    if not pipeline_id:
+        # A missing project.json lands in the except as well
+        try:
+            meta = json_loads(read_bytes(Path(project_root) / "config" / "project.json"))
+            pipeline_id = meta.get("pipeline_id")
+        except: pass
+    return pipeline_id
+
+def get_project_status(project_id, projects_dir, links_dir, events=None, artifact_index=None, pipeline=None):
+    """
+    Get project status.
+
+    events, artifact_index and pipeline may be passed in pre-loaded to skip
+    re-reading the ledger, artifact_index.json and pipeline YAML.
+    """
     project_root = Path(projects_dir) / project_id
     if not project_root.exists():
         return {"error": f"Project {project_id} not found"}
 
-    orchestrator = Orchestrator(links_dir, projects_dir)
-    ledger = Ledger(str(project_root))
-    events = ledger.get_events()
+    if events is None:
+        events = Ledger(str(project_root)).get_events()
     
     # Artifact Index
-    artifact_index = {}
-    index_path = project_root / "artifact_index.json"
-    if index_path.exists():
-        with open(index_path, "r") as f:
-            artifact_index = json.load(f)
+    if artifact_index is None:
+        artifact_index = _load_index(project_root)
 
-    # Status Index
+    # Status Index: only the latest tracked status per link matters, so walk
+    # the ledger backwards and touch each link once.
     link_status = {}
-    pipeline_id = None
-    for ev in events:
-        pipeline_id = ev.get("pipeline_id")
+    for ev in reversed(events):
         l_id = ev.get("link_id")
-        if not l_id: continue
+        if not l_id or l_id in link_status: continue
         status = ev.get("status")
-        if status in ["STARTED", "SUCCEEDED", "FAILED", "SKIPPED"]:
+        if status in _TRACKED_STATUSES:
             link_status[l_id] = status
     
-    # Fallback to project metadata if ledger is empty
-    if not pipeline_id:
-        meta_path = project_root / "config" / "project.json"
-        if meta_path.exists():
-            with open(meta_path, "r") as f:
-                try:
-                    meta = json.load(f)
-                    pipeline_id = meta.get("pipeline_id")
-                except: pass
+    # Pipeline ID (falls back to project metadata if ledger is empty)
+    pipeline_id = _infer_pipeline_id(project_root, events)
 
     # Next Step Analysis
     next_link = None
     required_inputs = []
     
-    pipeline_path = project_root / "pipeline.yaml"
-    if not pipeline_path.exists():
-        pipeline_path = Path("dawn/pipelines") / f"{pipeline_id}.yaml" if pipeline_id else None
-        
-    if pipeline_path and pipeline_path.exists():
-        with open(pipeline_path, "r") as f:
-            pipeline = yaml.safe_load(f)
+    if pipeline is None:
+        candidates = [project_root / "pipeline.yaml"]
+        if pipeline_id:
+            candidates.append(Path("dawn/pipelines") / f"{pipeline_id}.yaml")
+        for pipeline_path in candidates:
+            try:
+                pipeline = _load_pipeline(pipeline_path)
+                break
+            except FileNotFoundError:
+                continue
             
+    if pipeline:
         links = pipeline.get("links", [])
         for l_info in links:
             l_id = l_info if isinstance(l_info, str) else l_info.get("id")
@@ -65,6 +106,8 @@ def get_project_status(project_id, projects_dir, links_dir):
             
             if status == "PENDING" or status == "FAILED":
                 next_link = l_id
+                # Link discovery is only needed to report the next step's inputs
+                orchestrator = Orchestrator(links_dir, projects_dir)
                 meta = orchestrator.registry.get_link(l_id)
                 if meta:
                     requires = meta["metadata"].get("spec", {}).get("requires", [])
@@ -118,9 +161,13 @@ def main():
                 pipeline = "dawn/pipelines/app_mvp.yaml" # Default release-capable pipeline
             
             if not pipeline:
-                # Try to infer from ledger
-                status = get_project_status(args.project, args.projects_dir, args.links_dir)
-                pipeline_id = status.get("pipeline_id")
+                # Try to infer from ledger; only the pipeline ID is needed here,
+                # the full status is computed once after the run.
+                project_root = Path(args.projects_dir) / args.project
+                pipeline_id = None
+                if project_root.exists():
+                    events = Ledger(str(project_root)).get_events()
+                    pipeline_id = _infer_pipeline_id(project_root, events)
                 if pipeline_id:
                     pipeline = f"dawn/pipelines/{pipeline_id}.yaml"
             
@@ -138,10 +185,7 @@ def main():
                 art_id = art_args.get("artifactId")
                 
                 project_root = Path(args.projects_dir) / args.project
-                index_path = project_root / "artifact_index.json"
-                
-                with open(index_path, "r") as f:
-                    index = json.load(f)
+                index = _load_index(project_root)
                 
                 if art_id in index:
                     art_path = Path(index[art_id]["path"])
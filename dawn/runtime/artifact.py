@@ -1,8 +1,8 @@
 """CLI tool for resolving and inspecting project artifacts by artifact ID."""
 import argparse
 import os
-import json
 from pathlib import Path
+from dawn.runtime.fileio import json_loads, read_bytes
 
 def resolve_artifact(project_id: str, artifact_id: str, print_content: bool, projects_dir: str):
     """Resolve artifact."""
@@ -13,8 +13,7 @@ def resolve_artifact(project_id: str, artifact_id: str, print_content: bool, pro
         print(f"ERROR: Artifact index not found for project '{project_id}' at {index_path}")
         return
 
-    with open(index_path, "r") as f:
-        index = json.load(f)
+    index = json_loads(read_bytes(index_path))
 
     if artifact_id not in index:
         print(f"ERROR: Artifact ID '{artifact_id}' not found in project '{project_id}'.")
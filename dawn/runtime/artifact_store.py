@@ -1,13 +1,63 @@
 """Persistent artifact registry and scoped file store for a single project run."""
 import os
+import functools
 import hashlib
+import mmap
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union
+
+from .fileio import json_dumps, json_dumps_compact, json_loads, read_bytes, write_bytes_atomic
+
+# Optional BLAKE3 digest backend, selected with DAWN_DIGEST=blake3
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+SUPPORTED_DIGEST_ALGOS = ("sha256", "blake3")
+
+# Manifests with at least this many records are probed on the digest pool
+REHYDRATE_PARALLEL_MIN = 16
+
+# write_artifact payload type -> bytes encoder; anything else is written as str(content)
+_ARTIFACT_ENCODERS = {
+    bytes: bytes,
+    bytearray: bytes,
+    dict: json_dumps,
+    list: json_dumps,
+}
+
+def _encode_artifact(content: Any) -> bytes:
+    """Encode a write_artifact payload to bytes."""
+    encoder = _ARTIFACT_ENCODERS.get(type(content))
+    if encoder is None:
+        # Subclasses (OrderedDict, ...) resolve through isinstance
+        encoder = next((enc for typ, enc in _ARTIFACT_ENCODERS.items() if isinstance(content, typ)), None)
+    if encoder is None:
+        return str(content).encode("utf-8")
+    return encoder(content)
+
+# Shared hashing pool for register_batch; both hashers release the GIL in update()
+_DIGEST_POOL: Optional[ThreadPoolExecutor] = None
+_DIGEST_POOL_LOCK = threading.Lock()
+
+def _get_digest_pool() -> ThreadPoolExecutor:
+    """Create the shared digest pool on first use."""
+    global _DIGEST_POOL
+    with _DIGEST_POOL_LOCK:
+        if _DIGEST_POOL is None:
+            _DIGEST_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                              thread_name_prefix="dawn-digest")
+        return _DIGEST_POOL
 
 class ArtifactStore:
     def __init__(self, project_root: str):
         """ init ."""
+        self.digest_algo = self._resolve_digest_algo()
         self.project_root = Path(project_root)
         self.artifacts_dir = self.project_root / "artifacts"
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
@@ -18,12 +68,42 @@ class ArtifactStore:
         # Artifact registries: artifact_id -> {path, schema, producer_link_id, ...}
         self._registry: Dict[str, Dict[str, Any]] = {}
         self._shadow_registry: Dict[str, Dict[str, Any]] = {}
+        # producer_link_id -> artifact IDs (insertion-ordered set) for each registry
+        self._by_link: Dict[Optional[str], Dict[str, None]] = {}
+        self._shadow_by_link: Dict[Optional[str], Dict[str, None]] = {}
+
+        # Link directories already created by get_link_dir
+        self._mkdir_cache: Set[Path] = set()
+
+        # Digest cache: path -> (st_ino, st_mtime_ns, st_size, hex digest), persisted
+        # across runs in artifacts/.digest_cache.json
+        self._digest_cache_path = self.artifacts_dir / ".digest_cache.json"
+        self._digest_cache: Dict[str, Tuple[int, int, int, str]] = self._load_digest_cache()
+        self._digest_cache_dirty = False
+
+        # Net bytes added under the project by hashed registrations (measured
+        # against the digest cache's previous size for each path) and by
+        # manifest writes
+        self.size_delta = 0
+        # Guards the registries and size_delta against links running concurrently
+        self._lock = threading.Lock()
 
         # Global persistent artifacts (shared across projects)
         # Assuming DAWN root is parents[1] of projects/
         self.global_artifacts_dir = self.project_root.parent.parent / "artifacts"
         self.global_artifacts_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _resolve_digest_algo() -> str:
+        """Read the DAWN_DIGEST backend switch (default sha256)."""
+        algo = os.environ.get("DAWN_DIGEST", "sha256").strip().lower()
+        if algo not in SUPPORTED_DIGEST_ALGOS:
+            raise ValueError(f"Unsupported DAWN_DIGEST '{algo}'; expected one of {SUPPORTED_DIGEST_ALGOS}")
+        if algo == "blake3" and not BLAKE3_AVAILABLE:
+            print("WARNING: DAWN_DIGEST=blake3 but the blake3 package is not installed; using sha256")
+            return "sha256"
+        return algo
+
     def get_global_path(self, artifact_name: str) -> Path:
         """Get the path for a global persistent artifact."""
         return self.global_artifacts_dir / artifact_name
@@ -64,23 +144,94 @@ class ArtifactStore:
         with open(path, "w") as f:
             json.dump(data, f, indent=2, sort_keys=True)
 
-    def register(self, artifact_id: str, abs_path: str, schema: Optional[str] = None,
+    def register(self, artifact_id: str, abs_path: Union[str, os.PathLike], schema: Optional[str] = None,
                  producer_link_id: Optional[str] = None, blob_uri: Optional[str] = None,
-                 is_shadow: bool = False):
-        """Register an artifact in the runtime registry."""
+                 is_shadow: bool = False, digest: Optional[str] = None):
+        """
+        Register an artifact in the runtime registry.
+
+        Pass digest when it is already known to skip the stat and hash.
+        """
+        self.register_batch([{
+            "artifact_id": artifact_id, "abs_path": abs_path, "schema": schema,
+            "producer_link_id": producer_link_id, "blob_uri": blob_uri,
+            "is_shadow": is_shadow, "digest": digest
+        }])
+
+    def register_batch(self, records: Iterable[Dict[str, Any]]):
+        """
+        Register several artifacts at once.
+
+        Each record holds register() keyword arguments. Missing digests are
+        computed concurrently on the shared digest pool.
+        """
+        records = [dict(r) for r in records]
+        unhashed = [r for r in records if r.get("digest") is None]
+        paths = [r["abs_path"] for r in unhashed]
+        keys = [os.path.abspath(p) for p in paths]
+        previous = [self._digest_cache.get(key) for key in keys]
+        if len(paths) > 1:
+            digests = _get_digest_pool().map(self._digest_or_none, paths)
+        else:
+            digests = map(self._digest_or_none, paths)
+        counted = {}  # a path registered twice in one batch only counts once
+        delta = 0
+        for r, key, old, digest in zip(unhashed, keys, previous, digests):
+            r["digest"] = digest
+            if digest is not None:
+                entry = self._digest_cache[key]
+                r["digest_signature"] = list(entry[:3])
+                old = counted.get(key, old)
+                delta += entry[2] - (old[2] if old else 0)
+                counted[key] = entry
+
+        with self._lock:
+            self.size_delta += delta
+            for r in records:
+                self._insert(**r)
+
+    def _digest_or_none(self, abs_path: Union[str, os.PathLike]) -> Optional[str]:
+        """Digest of abs_path, or None if the file does not exist."""
+        try:
+            return self.get_digest(abs_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def _insert(self, artifact_id: str, abs_path: Union[str, os.PathLike], schema: Optional[str] = None,
+                producer_link_id: Optional[str] = None, blob_uri: Optional[str] = None,
+                is_shadow: bool = False, digest: Optional[str] = None,
+                digest_signature: Optional[List[int]] = None):
+        """
+        Store a registry record.
+
+        digest_signature is the file's [st_ino, st_mtime_ns, st_size] when the
+        digest was computed, letting rehydration tell whether it still applies.
+        """
         record = {
-            "path": abs_path,
+            "path": os.fspath(abs_path),
             "schema": schema,
             "producer_link_id": producer_link_id,
             "blob_uri": blob_uri,
-            "digest": self.get_digest(Path(abs_path)) if Path(abs_path).exists() else None,
+            "digest": digest,
+            "digest_algo": self.digest_algo,
             "is_shadow": is_shadow
         }
-        
+        if digest_signature is not None:
+            record["digest_signature"] = digest_signature
+        self._store_record(artifact_id, record, is_shadow)
+
+    def _store_record(self, artifact_id: str, record: Dict[str, Any], is_shadow: bool):
+        """Put a record in the (shadow) registry and keep its by-link index in step."""
         if is_shadow:
-            self._shadow_registry[artifact_id] = record
+            registry, by_link = self._shadow_registry, self._shadow_by_link
         else:
-            self._registry[artifact_id] = record
+            registry, by_link = self._registry, self._by_link
+
+        previous = registry.get(artifact_id)
+        if previous is not None:
+            by_link.get(previous.get("producer_link_id"), {}).pop(artifact_id, None)
+        registry[artifact_id] = record
+        by_link.setdefault(record.get("producer_link_id"), {})[artifact_id] = None
     
     def get(self, artifact_id: str, include_shadow: bool = False) -> Optional[Dict[str, Any]]:
         """Get artifact metadata from registry."""
@@ -96,26 +247,42 @@ class ArtifactStore:
         """Get link dir."""
         base = self.shadow_dir if is_shadow else self.artifacts_dir
         link_dir = base / link_id
-        link_dir.mkdir(parents=True, exist_ok=True)
+        if link_dir not in self._mkdir_cache:
+            link_dir.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(link_dir)
         return link_dir
 
     def write_artifact(self, link_id: str, filename: str, content: Any, mode: str = "w") -> Path:
-        """Write artifact."""
+        """
+        Write artifact.
+
+        dict/list are written as indented, key-sorted JSON, bytes as-is and
+        anything else as UTF-8 text. mode "a" appends instead of replacing.
+        """
         link_dir = self.get_link_dir(link_id)
         file_path = link_dir / filename
-        
-        if isinstance(content, (bytes, bytearray)):
-            with open(file_path, "wb") as f:
-                f.write(content)
-        elif isinstance(content, (dict, list)):
-            with open(file_path, "w") as f:
-                json.dump(content, f, indent=2, sort_keys=True)
-        else:
-            with open(file_path, mode) as f:
-                f.write(str(content))
+        data = _encode_artifact(content)
+
+        if "a" in mode:
+            with open(file_path, "ab") as f:
+                f.write(data)
+        # Idempotent reruns: leave identical files untouched so their mtime
+        # (and therefore any cached digest) stays valid.
+        elif not self._has_content(file_path, data):
+            write_bytes_atomic(file_path, data)
         
         return file_path
 
+    @staticmethod
+    def _has_content(file_path: Path, data: bytes) -> bool:
+        """True if file_path already holds exactly data."""
+        try:
+            if os.stat(file_path).st_size != len(data):
+                return False
+            return read_bytes(file_path) == data
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
     def read_artifact(self, link_id: str, filename: str) -> Optional[Any]:
         """Read a project-specific artifact."""
         link_dir = self.get_link_dir(link_id)
@@ -128,64 +295,238 @@ class ArtifactStore:
             return f.read()
 
     def get_digest(self, file_path: Path) -> str:
-        """Get digest."""
-        sha256_hash = hashlib.sha256()
+        """Get the SHA-256 digest of a file, reusing the cached value if unchanged."""
+        st = os.stat(file_path)
+        path = os.path.abspath(file_path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._digest_cache.get(path)
+        if cached is not None and cached[:3] == signature:
+            return cached[3]
+        digest = self._compute_digest(file_path)
+        self._digest_cache[path] = signature + (digest,)
+        self._digest_cache_dirty = True
+        return digest
+
+    def _load_digest_cache(self) -> Dict[str, Tuple[int, int, int, str]]:
+        """Load the on-disk digest cache; entries from another algorithm are ignored."""
+        try:
+            data = json_loads(read_bytes(self._digest_cache_path))
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("digest_algo") != self.digest_algo:
+            return {}
+        return {path: tuple(entry) for path, entry in data.get("entries", {}).items()}
+
+    def flush_digest_cache(self):
+        """
+        Persist the digest cache if it changed since the last flush.
+
+        Entries for files that no longer exist (deleted or renamed artifacts)
+        are dropped. Flushes are serialized under the store lock since
+        concurrent links all save here; the encoder gets a snapshot of the cache.
+        """
+        with self._lock:
+            if not self._digest_cache_dirty:
+                return
+            for path in list(self._digest_cache):
+                if not os.path.exists(path):
+                    self._digest_cache.pop(path, None)
+            data = {"digest_algo": self.digest_algo, "entries": dict(self._digest_cache)}
+            self._digest_cache_dirty = False
+            try:
+                write_bytes_atomic(self._digest_cache_path, json_dumps_compact(data))
+            except BaseException:
+                self._digest_cache_dirty = True
+                raise
+
+    def _new_hasher(self):
+        """Create a hasher for the store's digest algorithm."""
+        if self.digest_algo == "blake3":
+            # SIMD tree hash; AUTO spreads large inputs across cores
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.sha256()  # OpenSSL uses SHA-NI when the CPU has it
+
+    def _compute_digest(self, file_path: Path) -> str:
+        """Hash a file with the store's digest algorithm, mapping it into memory where possible."""
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            # One update over the mapped file: no copies, GIL released by the hasher
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher = self._new_hasher()
+                    hasher.update(mm)
+                    return hasher.hexdigest()
+            except (ValueError, OSError):
+                pass  # empty or non-mappable file; stream it instead
+
+            if self.digest_algo == "sha256" and hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            hasher = self._new_hasher()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+            return hasher.hexdigest()
 
     def list_artifacts_for_link(self, link_id: str) -> List[Path]:
         """List artifacts for link."""
         link_dir = self.artifacts_dir / link_id
-        if not link_dir.exists():
+        try:
+            # DirEntry.is_file() answers from d_type; only symlinks need a stat
+            with os.scandir(link_dir) as entries:
+                return [Path(e.path) for e in entries if e.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        return [p for p in link_dir.iterdir() if p.is_file()]
+
+    @staticmethod
+    def _manifest_filenames(is_shadow: bool) -> Tuple[str, str]:
+        """Compacted manifest and append-only journal filenames."""
+        if is_shadow:
+            return ".shadow_artifacts.json", ".shadow_artifacts.jsonl"
+        return ".dawn_artifacts.json", ".dawn_artifacts.jsonl"
+
+    def append_manifest_record(self, artifact_id: str, meta: Dict[str, Any], link_id: str,
+                               is_shadow: bool = False):
+        """
+        Append one artifact record to the link's manifest journal.
+
+        The journal is folded into the compacted manifest by save_manifest.
+        """
+        base = self.shadow_dir if is_shadow else self.artifacts_dir
+        journal_path = base / link_id / self._manifest_filenames(is_shadow)[1]
+        line = json_dumps_compact({"artifact_id": artifact_id, "meta": meta}) + b"\n"
+        with open(journal_path, "ab") as f:
+            f.write(line)
+        with self._lock:
+            self.size_delta += len(line)
 
     def save_manifest(self, link_id: str, is_shadow: bool = False):
         """
         Save artifact registry manifest for this link.
+
+        This compacts the link's manifest: the journal written by
+        append_manifest_record is superseded and removed.
         """
-        registry = self._shadow_registry if is_shadow else self._registry
-        link_artifacts = {
-            artifact_id: meta 
-            for artifact_id, meta in registry.items()
-            if meta.get("producer_link_id") == link_id
-        }
+        if is_shadow:
+            registry, by_link = self._shadow_registry, self._shadow_by_link
+        else:
+            registry, by_link = self._registry, self._by_link
+        with self._lock:
+            link_artifacts = {artifact_id: registry[artifact_id] for artifact_id in by_link.get(link_id, ())}
         
         base = self.shadow_dir if is_shadow else self.artifacts_dir
-        manifest_filename = ".shadow_artifacts.json" if is_shadow else ".dawn_artifacts.json"
+        manifest_filename, journal_filename = self._manifest_filenames(is_shadow)
         manifest_path = base / link_id / manifest_filename
         
-        with open(manifest_path, "w") as f:
-            json.dump(link_artifacts, f, indent=2, sort_keys=True)
+        data = json_dumps(link_artifacts)
+        delta = len(data) - self._file_size(manifest_path)
+        write_bytes_atomic(manifest_path, data)
+        journal_path = base / link_id / journal_filename
+        journal_size = self._file_size(journal_path)
+        if journal_size:
+            try:
+                os.unlink(journal_path)
+                delta -= journal_size
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self.size_delta += delta
+        self.flush_digest_cache()
+
+    @staticmethod
+    def _file_size(path: Union[str, os.PathLike]) -> int:
+        """Size of path, or 0 if it does not exist."""
+        try:
+            return os.stat(path).st_size
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+
+    def _digest_trusted(self, meta: Dict[str, Any]) -> bool:
+        """Whether a manifest record's digest may seed the digest cache (if the stat still matches)."""
+        return (bool(meta.get("digest")) and bool(meta.get("digest_signature"))
+                and meta.get("digest_algo", "sha256") == self.digest_algo)
+
+    def _probe_artifact(self, link_dir: str, entries: Dict[str, os.DirEntry],
+                        meta: Dict[str, Any]) -> Tuple[Optional[str], Optional[os.stat_result]]:
+        """
+        Resolve a manifest record to (abs path, stat), or (None, None) if the file is gone.
+
+        Files listed in link_dir are only stat'ed when their digest is trusted.
+        """
+        path = os.path.abspath(meta["path"])
+        parent, name = os.path.split(path)
+        try:
+            if parent == link_dir:
+                entry = entries.get(name)
+                if entry is None:
+                    return None, None
+                return path, entry.stat() if self._digest_trusted(meta) else None
+            return path, os.stat(path)
+        except OSError:
+            return None, None
 
     def rehydrate_from_link_dir(self, link_id: str, is_shadow: bool = False) -> int:
         """
         Rehydrate artifact registry from link's manifest.
         
-        Reads .dawn_artifacts.json (or .shadow_artifacts.json) and re-registers all artifacts.
+        Reads .dawn_artifacts.json (or .shadow_artifacts.json) plus any records
+        journaled to the matching .jsonl since, and re-registers all artifacts.
         Returns number of artifacts rehydrated.
         """
         base = self.shadow_dir if is_shadow else self.artifacts_dir
-        manifest_filename = ".shadow_artifacts.json" if is_shadow else ".dawn_artifacts.json"
-        manifest_path = base / link_id / manifest_filename
-        
-        if not manifest_path.exists():
+        manifest_filename, journal_filename = self._manifest_filenames(is_shadow)
+        link_dir = os.path.abspath(base / link_id)
+
+        # One directory listing answers the existence checks for every
+        # artifact stored directly in the link dir (and for the manifest).
+        try:
+            with os.scandir(link_dir) as it:
+                entries = {e.name: e for e in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+        if manifest_filename not in entries and journal_filename not in entries:
             return 0
         
-        with open(manifest_path, "r") as f:
-            link_artifacts = json.load(f)
+        link_artifacts = {}
+        if manifest_filename in entries:
+            link_artifacts = json_loads(read_bytes(entries[manifest_filename].path))
+        if journal_filename in entries:
+            # Later records win, as with repeated register() calls
+            for line in read_bytes(entries[journal_filename].path).split(b"\n"):
+                if line:
+                    record = json_loads(line)
+                    link_artifacts[record["artifact_id"]] = record["meta"]
         
+        # Existence/stat probes are independent; large manifests issue them
+        # concurrently on the digest pool
+        probe = functools.partial(self._probe_artifact, link_dir, entries)
+        if len(link_artifacts) >= REHYDRATE_PARALLEL_MIN:
+            probes = _get_digest_pool().map(probe, link_artifacts.values())
+        else:
+            probes = map(probe, link_artifacts.values())
+
         count = 0
-        for artifact_id, meta in link_artifacts.items():
-            # Verify file still exists
-            if Path(meta["path"]).exists():
-                if is_shadow:
-                    self._shadow_registry[artifact_id] = meta
-                else:
-                    self._registry[artifact_id] = meta
-                count += 1
+        for (artifact_id, meta), (path, st) in zip(link_artifacts.items(), probes):
+            if path is None:
+                continue  # file no longer exists
+
+            # Warm rehydrate trusts the manifest digest instead of re-hashing
+            # (when it used the same algorithm), but only while the file's
+            # stat still matches the one the digest was computed at; a file
+            # edited since is left to be hashed lazily.
+            if self._digest_trusted(meta):
+                signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+                if list(signature) == meta["digest_signature"]:
+                    cached = self._digest_cache.get(path)
+                    if cached is None or cached[:3] != signature:
+                        self._digest_cache[path] = signature + (meta["digest"],)
+
+            with self._lock:
+                self._store_record(artifact_id, meta, is_shadow)
+            count += 1
         
         return count
 
@@ -1,6 +1,7 @@
 """Coherence-scoring providers that compare IR snapshots to detect structural drift."""
 import abc
 import hashlib
+import json
 from typing import Dict, Any, List
 
 class CoherenceProvider(abc.ABC):
@@ -33,13 +34,14 @@ class SimpleStructuralCoherenceProvider(CoherenceProvider):
             return {"score": 1.0, "evidence": "No original nodes to compare against"}
             
         # Calculate ratio of nodes preserved (very basic)
-        overlap = [n for n in curr_nodes if n.get("name") in [on.get("name") for on in orig_nodes]]
-        score = len(overlap) / len(orig_nodes)
+        orig_names = {on.get("name") for on in orig_nodes}
+        overlap_count = sum(1 for n in curr_nodes if n.get("name") in orig_names)
+        score = overlap_count / len(orig_nodes)
         
-        evidence = f"Preserved {len(overlap)} out of {len(orig_nodes)} original nodes."
+        evidence = f"Preserved {overlap_count} out of {len(orig_nodes)} original nodes."
         
         # Check for "Hot Mess" indicators (e.g. huge influx of new nodes without parent groups)
-        new_nodes = len(curr_nodes) - len(overlap)
+        new_nodes = len(curr_nodes) - overlap_count
         if new_nodes > len(orig_nodes) * 2:
             score *= 0.5
             evidence += f" Warning: High entropy detected with {new_nodes} new nodes."
@@ -57,12 +59,16 @@ class MockLLMCoherenceProvider(CoherenceProvider):
         # For demo purposes, we'll hash the current IR and return a stable-ish score
         # In reality, this would call an LLM with the two IRs.
         """Calculate coherence."""
-        ir_str = str(current_ir)
-        h = hashlib.md5(ir_str.encode()).hexdigest()
+        try:
+            ir_bytes = json.dumps(current_ir, sort_keys=True, separators=(",", ":")).encode()
+        except (TypeError, ValueError):
+            # Not JSON-serializable, or circular
+            ir_bytes = str(current_ir).encode()
+        h = hashlib.md5(ir_bytes).hexdigest()
         
         # Just a dummy deterministic score for testing
         score = 0.95
-        if "hot_mess" in ir_str.lower():
+        if b"hot_mess" in ir_bytes.lower():
             score = 0.4
             
         return {
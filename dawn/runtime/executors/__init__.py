@@ -1,14 +1,27 @@
+import importlib
+
 from .base import Executor, RunResult
-from .local import LocalExecutor
-from .subprocess import SubprocessExecutor
-from .docker import DockerExecutor
+
+# Executor name -> (backend module, class). Backends are imported on first
+# use so a process only pays for the one it runs.
+_BACKENDS = {
+    "local": (".local", "LocalExecutor"),
+    "subprocess": (".subprocess", "SubprocessExecutor"),
+    "docker": (".docker", "DockerExecutor"),
+}
+_CLASS_MODULES = {cls: module for module, cls in _BACKENDS.values()}
+
+__all__ = ["Executor", "RunResult", "get_executor", "LocalExecutor", "SubprocessExecutor", "DockerExecutor"]
+
+def __getattr__(name: str):
+    # PEP 562: keeps `from dawn.runtime.executors import LocalExecutor` working lazily
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
 
 def get_executor(name: str = "local", **kwargs) -> Executor:
-    if name == "local":
-        return LocalExecutor(**kwargs)
-    elif name == "subprocess":
-        return SubprocessExecutor(**kwargs)
-    elif name == "docker":
-        return DockerExecutor(**kwargs)
-    else:
+    if name not in _BACKENDS:
         raise ValueError(f"Unknown executor: {name}")
+    module, cls = _BACKENDS[name]
+    return getattr(importlib.import_module(module, __name__), cls)(**kwargs)
@@ -5,11 +5,13 @@ import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from .base import Executor, RunResult
+from ..project_index import update_project_index, utc_timestamp
 
 class DockerExecutor(Executor):
     def __init__(self, projects_dir: str = "projects", **kwargs):
         """ init ."""
         self.projects_dir = Path(projects_dir).absolute()
+        self._update_index = update_project_index
 
     def run_pipeline(
         self,
@@ -41,12 +43,20 @@ class DockerExecutor(Executor):
         # Project source is mounted as /app/projects/{project_id}
         # We need to use absolute paths for volumes
         workspace_root = Path(os.getcwd()).absolute()
+
+        # Bind-mount consistency: 'delegated' lets Docker Desktop (macOS/WSL)
+        # batch container writes back to the host; Linux ignores it. Set
+        # DAWN_DOCKER_MOUNT_MODE to another mode, or empty for the default.
+        mount_mode = os.environ.get("DAWN_DOCKER_MOUNT_MODE", "delegated")
+        volume = f"{workspace_root}:/app:{mount_mode}" if mount_mode else f"{workspace_root}:/app"
         
         cmd = [
             "docker", "run", "--rm",
             "--name", f"dawn-worker-{run_id}",
-            "-v", f"{workspace_root}:/app",
+            "-v", volume,
             "-e", "PYTHONPATH=/app",
+            "-e", "PYTHONDONTWRITEBYTECODE=1",
+            "-e", "PYTHONUNBUFFERED=1",
             image_name,
             "python3", "-m", "dawn.runtime.main",
             "--project", project_id,
@@ -57,32 +67,29 @@ class DockerExecutor(Executor):
         cmd.extend(["--profile", effective_profile])
 
         # Signal RUNNING immediately
-        try:
-            from ..project_index import update_project_index
-            update_project_index(project_root, pipeline_meta={
-                "id": pipeline_id,
-                "path": pipeline_path,
-                "profile": effective_profile,
-                "executor": "docker"
-            }, run_context={
-                "status": "RUNNING",
-                "run_id": run_id,
-                "worker_id": worker_id
-            })
-        except: pass
+        self._safe_index_update(project_root, pipeline_meta={
+            "id": pipeline_id,
+            "path": pipeline_path,
+            "profile": effective_profile,
+            "executor": "docker"
+        }, run_context={
+            "status": "RUNNING",
+            "run_id": run_id,
+            "worker_id": worker_id
+        })
 
         try:
             log_path = run_dir / "worker.log"
             with open(log_path, "w") as log_file:
-                process = subprocess.Popen(
+                returncode = subprocess.run(
                     cmd,
                     stdout=log_file,
                     stderr=subprocess.STDOUT,
-                    env=os.environ
-                )
-                process.wait()
+                    env=os.environ,
+                    check=False
+                ).returncode
 
-            status = "SUCCEEDED" if process.returncode == 0 else "FAILED"
+            status = "SUCCEEDED" if returncode == 0 else "FAILED"
             
             # Save run.json
             run_meta = {
@@ -91,8 +98,8 @@ class DockerExecutor(Executor):
                 "pipeline_path": pipeline_path,
                 "status": status,
                 "profile": effective_profile,
-                "exit_code": process.returncode,
-                "ended_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                "exit_code": returncode,
+                "ended_at": utc_timestamp()
             }
             if metadata:
                 run_meta["metadata"] = metadata
@@ -101,30 +108,28 @@ class DockerExecutor(Executor):
                 json.dump(run_meta, f, indent=2)
 
             # Update project index
-            try:
-                from ..project_index import update_project_index
-                update_project_index(project_root, pipeline_meta={
-                    "id": pipeline_id,
-                    "path": pipeline_path,
-                    "profile": effective_profile,
-                    "executor": "docker"
-                }, run_context={
-                    "status": status,
-                    "run_id": run_id,
-                    "worker_id": worker_id,
-                    "error": f"Container exit code: {process.returncode}" if status == "FAILED" else None
-                })
-            except: pass
+            self._safe_index_update(project_root, pipeline_meta={
+                "id": pipeline_id,
+                "path": pipeline_path,
+                "profile": effective_profile,
+                "executor": "docker"
+            }, run_context={
+                "status": status,
+                "run_id": run_id,
+                "worker_id": worker_id,
+                "error": f"Container exit code: {returncode}" if status == "FAILED" else None
+            })
 
-            report_path = str(project_root / "artifacts/package.project_report/project_report.html")
+            report_file = project_root / "artifacts/package.project_report/project_report.html"
+            report_path = str(report_file) if report_file.is_file() else None
             
             return RunResult(
                 status=status,
                 run_id=run_id,
                 project_id=project_id,
                 pipeline_ref=pipeline_path,
-                report_path=report_path if os.path.exists(report_path) else None,
-                errors={"exit_code": process.returncode} if status == "FAILED" else None
+                report_path=report_path,
+                errors={"exit_code": returncode} if status == "FAILED" else None
             )
         except Exception as e:
             return RunResult(
@@ -135,6 +140,13 @@ class DockerExecutor(Executor):
                 errors={"message": str(e)}
             )
 
+    def _safe_index_update(self, project_root: Path, pipeline_meta: Dict[str, Any], run_context: Dict[str, Any]):
+        """Update the project index; a failure here must not fail the run."""
+        try:
+            self._update_index(project_root, pipeline_meta=pipeline_meta, run_context=run_context)
+        except Exception:
+            pass
+
     def get_status(self, project_id: str) -> dict:
         """Get status."""
         return {"status": "unknown"}
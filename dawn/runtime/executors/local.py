@@ -5,12 +5,14 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from .base import Executor, RunResult
 from ..orchestrator import Orchestrator
+from ..project_index import update_project_index, utc_timestamp
 
 class LocalExecutor(Executor):
     def __init__(self, links_dir: str = "dawn/links", projects_dir: str = "projects", **kwargs):
         """ init ."""
         self.links_dir = links_dir
         self.projects_dir = projects_dir
+        self._update_index = update_project_index
 
     def run_pipeline(
         self,
@@ -41,19 +43,16 @@ class LocalExecutor(Executor):
         status = "RUNNING"
 
         # Signal RUNNING immediately
-        try:
-            from ..project_index import update_project_index
-            update_project_index(project_root, pipeline_meta={
-                "id": pipeline_id,
-                "path": pipeline_path,
-                "profile": profile or isolation,
-                "executor": "local"
-            }, run_context={
-                "status": status,
-                "run_id": run_id,
-                "worker_id": worker_id
-            })
-        except: pass
+        self._safe_index_update(project_root, pipeline_meta={
+            "id": pipeline_id,
+            "path": pipeline_path,
+            "profile": profile or isolation,
+            "executor": "local"
+        }, run_context={
+            "status": status,
+            "run_id": run_id,
+            "worker_id": worker_id
+        })
 
         import contextlib
         import sys
@@ -79,7 +78,7 @@ class LocalExecutor(Executor):
             "status": status,
             "profile": profile or isolation,
             "errors": errors,
-            "ended_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            "ended_at": utc_timestamp()
         }
         if metadata:
             run_meta["metadata"] = metadata
@@ -87,23 +86,20 @@ class LocalExecutor(Executor):
             json.dump(run_meta, f, indent=2)
 
         # Update project index
-        try:
-            from ..project_index import update_project_index
-            update_project_index(project_root, pipeline_meta={
-                "id": pipeline_id,
-                "path": pipeline_path,
-                "profile": profile or isolation,
-                "executor": "local"
-            }, run_context={
-                "status": status,
-                "run_id": run_id,
-                "worker_id": worker_id,
-                "error": errors[0] if errors else None
-            })
-        except Exception as idx_err:
-            print(f"Warning: Failed to update project index: {idx_err}")
+        self._safe_index_update(project_root, pipeline_meta={
+            "id": pipeline_id,
+            "path": pipeline_path,
+            "profile": profile or isolation,
+            "executor": "local"
+        }, run_context={
+            "status": status,
+            "run_id": run_id,
+            "worker_id": worker_id,
+            "error": errors[0] if errors else None
+        })
 
-        report_path = project_root / "artifacts/package.project_report/project_report.html"
+        report_file = project_root / "artifacts/package.project_report/project_report.html"
+        report_path = str(report_file) if report_file.is_file() else None
         
         return RunResult(
             status=status,
@@ -111,9 +107,16 @@ class LocalExecutor(Executor):
             project_id=project_id,
             pipeline_ref=pipeline_path,
             errors={"errors": errors} if errors else None,
-            report_path=str(report_path) if report_path.exists() else None
+            report_path=report_path
         )
 
+    def _safe_index_update(self, project_root: Path, pipeline_meta: Dict[str, Any], run_context: Dict[str, Any]):
+        """Update the project index; a failure here must not fail the run."""
+        try:
+            self._update_index(project_root, pipeline_meta=pipeline_meta, run_context=run_context)
+        except Exception as idx_err:
+            print(f"Warning: Failed to update project index: {idx_err}")
+
     def get_status(self, project_id: str) -> dict:
         # Mock for now, could integrate with index reader later
         """Get status."""
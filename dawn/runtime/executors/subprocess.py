@@ -1,15 +1,56 @@
 import subprocess
 import os
 import json
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from .base import Executor, RunResult
+from ..project_index import update_project_index, utc_timestamp
+from ..worker_daemon import recv_frame, send_frame
+
+# Long-lived worker processes (dawn.runtime.worker_daemon), each serving one
+# run at a time. A run takes an idle worker or starts a new one, so concurrent
+# runs (e.g. for different projects) still execute in parallel; at most
+# MAX_IDLE_WORKERS are kept for reuse. DAWN_WORKER_EPHEMERAL=1 switches back
+# to a fresh interpreter per run.
+_WORKER_CMD = ["python3", "-m", "dawn.runtime.worker_daemon"]
+MAX_IDLE_WORKERS = 4
+_IDLE_WORKERS: List[subprocess.Popen] = []
+_WORKER_LOCK = threading.Lock()
+
+def _worker_env() -> Dict[str, str]:
+    """Environment for pipeline subprocesses."""
+    return {**os.environ, "PYTHONPATH": ".", "PYTHONUNBUFFERED": "1"}
+
+def _checkout_worker() -> subprocess.Popen:
+    """Take a live idle worker, or start a new one if none is free."""
+    with _WORKER_LOCK:
+        while _IDLE_WORKERS:
+            worker = _IDLE_WORKERS.pop()
+            if worker.poll() is None:
+                return worker
+    return subprocess.Popen(
+        _WORKER_CMD,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=_worker_env()
+    )
+
+def _checkin_worker(worker: subprocess.Popen):
+    """Return a worker to the idle pool; past MAX_IDLE_WORKERS it is shut down."""
+    with _WORKER_LOCK:
+        if len(_IDLE_WORKERS) < MAX_IDLE_WORKERS:
+            _IDLE_WORKERS.append(worker)
+            return
+    worker.stdin.close()  # the daemon exits on EOF
+    worker.wait()
 
 class SubprocessExecutor(Executor):
     def __init__(self, projects_dir: str = "projects", **kwargs):
         """ init ."""
         self.projects_dir = Path(projects_dir)
+        self._update_index = update_project_index
 
     def run_pipeline(
         self,
@@ -47,31 +88,31 @@ class SubprocessExecutor(Executor):
             cmd.extend(["--profile", effective_profile])
 
         # Signal RUNNING immediately
-        try:
-            from ..project_index import update_project_index
-            update_project_index(project_root, pipeline_meta={
-                "id": pipeline_id,
-                "path": pipeline_path,
-                "profile": effective_profile,
-                "executor": "subprocess"
-            }, run_context={
-                "status": "RUNNING",
-                "run_id": run_id,
-                "worker_id": worker_id
-            })
-        except: pass
+        self._safe_index_update(project_root, pipeline_meta={
+            "id": pipeline_id,
+            "path": pipeline_path,
+            "profile": effective_profile,
+            "executor": "subprocess"
+        }, run_context={
+            "status": "RUNNING",
+            "run_id": run_id,
+            "worker_id": worker_id
+        })
 
         try:
-            with open(log_path, "w") as log_file:
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=log_file,
-                    stderr=subprocess.STDOUT,
-                    env={**os.environ, "PYTHONPATH": ".", "PYTHONUNBUFFERED": "1"}
-                )
-                process.wait()
-
-            status = "SUCCEEDED" if process.returncode == 0 else "FAILED"
+            if os.environ.get("DAWN_WORKER_EPHEMERAL") == "1":
+                with open(log_path, "w") as log_file:
+                    returncode = subprocess.run(
+                        cmd,
+                        stdout=log_file,
+                        stderr=subprocess.STDOUT,
+                        env=_worker_env(),
+                        check=False
+                    ).returncode
+            else:
+                returncode = self._run_in_worker(project_id, pipeline_path, effective_profile, log_path)
+
+            status = "SUCCEEDED" if returncode == 0 else "FAILED"
             
             # Save run.json
             run_meta = {
@@ -80,8 +121,8 @@ class SubprocessExecutor(Executor):
                 "pipeline_path": pipeline_path,
                 "status": status,
                 "profile": effective_profile,
-                "exit_code": process.returncode,
-                "ended_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                "exit_code": returncode,
+                "ended_at": utc_timestamp()
             }
             if metadata:
                 run_meta["metadata"] = metadata
@@ -89,30 +130,28 @@ class SubprocessExecutor(Executor):
                 json.dump(run_meta, f, indent=2)
 
             # Update project index
-            try:
-                from ..project_index import update_project_index
-                update_project_index(project_root, pipeline_meta={
-                    "id": pipeline_id,
-                    "path": pipeline_path,
-                    "profile": effective_profile,
-                    "executor": "subprocess"
-                }, run_context={
-                    "status": status,
-                    "run_id": run_id,
-                    "worker_id": worker_id,
-                    "error": f"Exit code: {process.returncode}" if status == "FAILED" else None
-                })
-            except: pass
-
-            report_path = str(project_root / "artifacts/package.project_report/project_report.html")
+            self._safe_index_update(project_root, pipeline_meta={
+                "id": pipeline_id,
+                "path": pipeline_path,
+                "profile": effective_profile,
+                "executor": "subprocess"
+            }, run_context={
+                "status": status,
+                "run_id": run_id,
+                "worker_id": worker_id,
+                "error": f"Exit code: {returncode}" if status == "FAILED" else None
+            })
+
+            report_file = project_root / "artifacts/package.project_report/project_report.html"
+            report_path = str(report_file) if report_file.is_file() else None
             
             return RunResult(
                 status=status,
                 run_id=run_id,
                 project_id=project_id,
                 pipeline_ref=pipeline_path,
-                report_path=report_path if os.path.exists(report_path) else None,
-                errors={"exit_code": process.returncode} if status == "FAILED" else None
+                report_path=report_path,
+                errors={"exit_code": returncode} if status == "FAILED" else None
             )
         except Exception as e:
             return RunResult(
@@ -123,6 +162,35 @@ class SubprocessExecutor(Executor):
                 errors={"message": str(e)}
             )
 
+    def _run_in_worker(self, project_id: str, pipeline_path: str, profile: Optional[str],
+                       log_path: Path) -> int:
+        """Run a pipeline on a pooled worker daemon and return its exit code."""
+        request = {
+            "project_id": project_id,
+            "pipeline_path": pipeline_path,
+            "profile": profile,
+            "log_path": str(log_path.absolute())
+        }
+        worker = _checkout_worker()
+        try:
+            send_frame(worker.stdin, request)
+            reply = recv_frame(worker.stdout)
+            if reply is None:
+                raise EOFError(f"worker exited with code {worker.wait()}")
+        except (OSError, EOFError) as e:
+            worker.kill()
+            worker.wait()
+            raise RuntimeError(f"Pipeline worker failed: {e}")
+        _checkin_worker(worker)
+        return reply["exit_code"]
+
+    def _safe_index_update(self, project_root: Path, pipeline_meta: Dict[str, Any], run_context: Dict[str, Any]):
+        """Update the project index; a failure here must not fail the run."""
+        try:
+            self._update_index(project_root, pipeline_meta=pipeline_meta, run_context=run_context)
+        except Exception:
+            pass
+
     def get_status(self, project_id: str) -> dict:
         """Get status."""
         return {"status": "unknown"}
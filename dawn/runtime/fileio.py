@@ -0,0 +1,114 @@
+"""Low-overhead whole-file I/O helpers shared by the runtime and policy loader."""
+import itertools
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+# Optional orjson for faster JSON parsing and compact (JSONL) encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson turns integers beyond 64 bits into floats; a run of 20+ digits
+# (possibly such an integer) sends the document to the stdlib parser instead
+_WIDE_NUMBER = re.compile(rb"\d{20}")
+_WIDE_NUMBER_STR = re.compile(r"\d{20}")
+
+# Makes temp file names unique per write_bytes_atomic call within a process
+_TMP_COUNTER = itertools.count()
+
+
+def read_bytes(path: Union[str, Path]) -> bytes:
+    """
+    Read an entire file through a raw descriptor.
+
+    Skips the buffered/text I/O stack (isatty probe, seek, decode) that
+    open()/Path.read_text() add; small files are read in a single syscall.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+        if len(data) < size or not size:
+            # Short read or size unknown (e.g. procfs): drain to EOF
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 1 << 16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def write_bytes_atomic(path: Union[str, Path], data: bytes, mode: int = 0o644) -> None:
+    """
+    Write data to path atomically.
+
+    The bytes go to a sibling temp file through a raw descriptor (one write
+    syscall for typical payloads) and are then renamed over the target, so
+    readers never observe a partially written file. Each call gets its own
+    temp file, so concurrent writers of one path never clobber each other.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(
+        f"{path.name}.{os.getpid()}.{threading.get_ident()}.{next(_TMP_COUNTER)}.tmp"
+    )
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or str, using orjson when available.
+
+    Accepts everything json.loads does: documents with NaN/Infinity (which
+    json.dump writes by default) or integers wider than 64 bits are parsed
+    by the stdlib so values come back exactly.
+    """
+    if ORJSON_AVAILABLE:
+        wide = _WIDE_NUMBER if isinstance(data, (bytes, bytearray)) else _WIDE_NUMBER_STR
+        if not wide.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity; stdlib raises if it is truly invalid
+    return json.loads(data)
+
+
+def json_dumps_compact(obj: Any) -> bytes:
+    """Serialize obj as single-line JSON bytes in insertion order (for JSONL logs)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize obj as indented, key-sorted JSON bytes.
+
+    Always the stdlib encoder: artifacts and manifests written through this
+    are digested, so their bytes must not depend on whether orjson is
+    installed (orjson writes non-ASCII raw, NaN as null and floats as 1e16).
+    """
+    return json.dumps(obj, indent=2, sort_keys=True).encode()
@@ -0,0 +1,100 @@
+"""Optional inotify-backed tracking of files written under a project, for sandbox checks."""
+import os
+from typing import Iterable, Optional, Set, Union
+
+# Optional inotify_simple (Linux); without it callers fall back to tree snapshots
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+
+class FsWatcher:
+    """
+    Records files created, written or moved into a directory tree.
+
+    changed() drains the paths (relative to root) touched since the previous
+    call. Top-level directories named in skip_dirs are not watched. New
+    subdirectories are watched as they appear.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike], skip_dirs: Iterable[str] = ()):
+        self.root = os.fspath(root)
+        self.skip_dirs = frozenset(skip_dirs)
+        self._inotify = INotify()
+        self._mask = inotify_flags.CREATE | inotify_flags.MODIFY | inotify_flags.MOVED_TO
+        self._dirs = {}  # watch descriptor -> directory relative to root ("" for root)
+        self._pending: Set[str] = set()
+        self._overflowed = False
+        try:
+            self._watch_tree("", record=False)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, rel_dir: str, record: bool):
+        """Watch rel_dir and everything below it; with record, its files count as touched."""
+        stack = [rel_dir]
+        while stack:
+            rel = stack.pop()
+            abs_dir = os.path.join(self.root, rel) if rel else self.root
+            try:
+                wd = self._inotify.add_watch(abs_dir, self._mask)
+            except FileNotFoundError:
+                continue  # removed before we got to it
+            self._dirs[wd] = rel
+            try:
+                it = os.scandir(abs_dir)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    child = os.path.join(rel, entry.name) if rel else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if rel or entry.name not in self.skip_dirs:
+                            stack.append(child)
+                    elif record:
+                        # Written before the watch existed
+                        self._pending.add(child)
+
+    def changed(self) -> Optional[Set[str]]:
+        """
+        Relative paths touched since the last call.
+
+        Returns None if events were lost (kernel queue overflow or watch
+        limit reached); the caller must then check the tree another way.
+        """
+        while True:
+            events = self._inotify.read(timeout=0)
+            if not events:
+                break
+            for event in events:
+                if event.mask & inotify_flags.Q_OVERFLOW:
+                    self._overflowed = True
+                    continue
+                if event.mask & inotify_flags.IGNORED:
+                    self._dirs.pop(event.wd, None)
+                    continue
+                rel = self._dirs.get(event.wd)
+                if rel is None or not event.name:
+                    continue
+                path = os.path.join(rel, event.name) if rel else event.name
+                if event.mask & inotify_flags.ISDIR:
+                    if rel or event.name not in self.skip_dirs:
+                        try:
+                            self._watch_tree(path, record=True)
+                        except OSError:
+                            self._overflowed = True  # out of watches
+                    continue
+                self._pending.add(path)
+
+        changed, self._pending = self._pending, set()
+        if self._overflowed:
+            self._overflowed = False
+            return None
+        return changed
+
+    def close(self):
+        """Release the inotify descriptor."""
+        self._inotify.close()
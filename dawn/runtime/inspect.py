@@ -2,10 +2,21 @@
 import argparse
 import os
 import json
+import sys
 from pathlib import Path
 from .ledger import Ledger
 from ..policy import get_policy_loader, PolicyValidationError
 
+# Row templates for the inspector tables (filled with str.format_map)
+_STATUS_ROW = "  {mark} {link_id:<30} {status}"
+_ARTIFACT_ROW = "  {art_id:<35} {link:<25} {short_digest:<10}"
+_PATH_ROW = "  • {art_id:<35} -> {rel_path}"
+
+def _write_rows(rows):
+    """Write a table section to stdout in one call."""
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
+
 def inspect_project(project_id: str, projects_dir: str = None):
     """Inspect project."""
     if projects_dir is None:
@@ -19,21 +30,14 @@ def inspect_project(project_id: str, projects_dir: str = None):
         return
 
     ledger = Ledger(str(project_root))
-    events = ledger.get_events()
-    
-    if not events:
-        print(f"Project {project_id} has no ledger events.")
-        return
-
-    print("\n" + "=" * 80)
-    print(f" DAWN PROJECT INSPECTOR: {project_id}")
-    print("=" * 80)
     
-    # Reconstruct artifact index from ledger
+    # Reconstruct artifact index from ledger, streaming it in a single pass
     artifact_index = {}
     last_status = {}
+    has_events = False
     
-    for event in events:
+    for event in ledger.iter_events():
+        has_events = True
         link_id = event["link_id"]
         status = event["status"]
         last_status[link_id] = status
@@ -44,28 +48,44 @@ def inspect_project(project_id: str, projects_dir: str = None):
                 artifact_index[art_id] = {
                     "path": info["path"],
                     "digest": info["digest"],
+                    "short_digest": info["digest"][:8],
                     "link": link_id
                 }
 
+    if not has_events:
+        print(f"Project {project_id} has no ledger events.")
+        return
+
+    print("\n" + "=" * 80)
+    print(f" DAWN PROJECT INSPECTOR: {project_id}")
+    print("=" * 80)
+
     print(f"\n[PIPELINE STATUS]")
-    for link_id, status in last_status.items():
-        color = "✓" if status == "SUCCEEDED" else "✗"
-        print(f"  {color} {link_id:<30} {status}")
+    status_row = _STATUS_ROW.format
+    _write_rows([
+        status_row(mark="✓" if status == "SUCCEEDED" else "✗", link_id=link_id, status=status)
+        for link_id, status in last_status.items()
+    ])
 
     print(f"\n[ARTIFACT INDEX]")
     if not artifact_index:
         print("  No artifacts found.")
     else:
-        print(f"  {'Artifact ID':<35} {'Producer':<25} {'Digest (Short)':<10}")
-        print(f"  {'-' * 35} {'-' * 25} {'-' * 10}")
-        for art_id, info in artifact_index.items():
-            short_digest = info["digest"][:8]
-            print(f"  {art_id:<35} {info['link']:<25} {short_digest:<10}")
+        rows = [
+            f"  {'Artifact ID':<35} {'Producer':<25} {'Digest (Short)':<10}",
+            f"  {'-' * 35} {'-' * 25} {'-' * 10}",
+        ]
+        artifact_row = _ARTIFACT_ROW.format_map
+        rows.extend(artifact_row({"art_id": art_id, **info}) for art_id, info in artifact_index.items())
+        _write_rows(rows)
 
     print(f"\n[KEY ARTIFACT PATHS]")
-    for art_id, info in artifact_index.items():
-        rel_path = os.path.relpath(info["path"], os.getcwd())
-        print(f"  • {art_id:<35} -> {rel_path}")
+    cwd = os.getcwd()
+    path_row = _PATH_ROW.format
+    _write_rows([
+        path_row(art_id=art_id, rel_path=os.path.relpath(info["path"], cwd))
+        for art_id, info in artifact_index.items()
+    ])
 
     # Policy info
     print(f"\n[POLICY]")
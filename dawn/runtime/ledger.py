@@ -1,10 +1,21 @@
 """Append-only JSONL event ledger that records the full execution history of a pipeline run."""
+import contextlib
 import json
+import os
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
+
+from .fileio import json_dumps_compact, json_loads, read_bytes
 
 class Ledger:
+    # Buffered events are appended in one write once this many accumulate
+    FLUSH_THRESHOLD = 32
+    # Block size for reading the ledger backwards in get_last_event
+    TAIL_CHUNK = 64 * 1024
+
     def __init__(self, project_root: str):
         """ init ."""
         self.project_root = Path(project_root)
@@ -12,6 +23,48 @@ class Ledger:
         self.ledger_dir.mkdir(parents=True, exist_ok=True)
         self.events_file = self.ledger_dir / "events.jsonl"
 
+        # Encoded event lines not yet on disk; guarded since timed-out link
+        # threads may still log while the orchestrator moves on.
+        self._pending: List[bytes] = []
+        self._lock = threading.Lock()
+        # Open batch() blocks; threshold flushes wait until the outermost exits
+        self._batch_depth = 0
+        # Nothing buffered is lost if the ledger is dropped or at interpreter exit
+        weakref.finalize(self, Ledger._write_pending, self.events_file, self._pending, self._lock)
+
+    @staticmethod
+    def _write_pending(events_file: Path, pending: List[bytes], lock: threading.Lock):
+        """Append all pending lines with a single open/write."""
+        with lock:
+            if not pending:
+                return
+            data = b"".join(pending)
+            with open(events_file, "ab") as f:
+                f.write(data)
+            pending.clear()
+
+    def flush(self):
+        """Write buffered events to events.jsonl."""
+        self._write_pending(self.events_file, self._pending, self._lock)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Hold events logged inside the block and append them in one write on exit.
+
+        Blocks may nest; the outermost one flushes, also when the block raises.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = self._batch_depth == 0
+            if outermost:
+                self.flush()
+
     def log_event(self, 
                   project_id: str, 
                   pipeline_id: str, 
@@ -45,18 +98,88 @@ class Ledger:
             "drift_metadata": drift_metadata if drift_metadata is not None else {}
         }
         
-        with open(self.events_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        line = json_dumps_compact(event) + b"\n"
+        with self._lock:
+            self._pending.append(line)
+            full = not self._batch_depth and len(self._pending) >= self.FLUSH_THRESHOLD
+        if full:
+            self.flush()
 
     def get_events(self, link_id: Optional[str] = None) -> list:
-        """Get events."""
+        """Get events, optionally only those for link_id."""
+        self.flush()
         events = []
-        if not self.events_file.exists():
+        try:
+            data = read_bytes(self.events_file)
+        except FileNotFoundError:
             return events
-            
-        with open(self.events_file, "r") as f:
+
+        needles = self._link_needles(link_id)
+        for line in data.split(b"\n"):
+            if not line or (needles and not any(n in line for n in needles)):
+                continue
+            event = json_loads(line)
+            if link_id is None or event["link_id"] == link_id:
+                events.append(event)
+        return events
+
+    def iter_events(self, link_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield events one at a time without holding the whole ledger in memory."""
+        self.flush()
+        try:
+            f = open(self.events_file, "rb")
+        except FileNotFoundError:
+            return
+
+        needles = self._link_needles(link_id)
+        with f:
             for line in f:
-                event = json.loads(line)
+                line = line.rstrip(b"\r\n")
+                if not line or (needles and not any(n in line for n in needles)):
+                    continue
+                event = json_loads(line)
                 if link_id is None or event["link_id"] == link_id:
-                    events.append(event)
-        return events
+                    yield event
+
+    def get_last_event(self, link_id: str, step_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Most recent event for link_id, optionally only with the given step_id.
+
+        The ledger is read backwards from the end in TAIL_CHUNK blocks, so only
+        the events logged after the match are scanned.
+        """
+        self.flush()
+        try:
+            f = open(self.events_file, "rb")
+        except FileNotFoundError:
+            return None
+
+        needles = self._link_needles(link_id)
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            carry = b""  # leading partial line of the block read last
+            while end > 0:
+                start = max(0, end - self.TAIL_CHUNK)
+                f.seek(start)
+                buf = f.read(end - start) + carry
+                end = start
+                if start:
+                    carry, _, buf = buf.partition(b"\n")
+                for line in reversed(buf.split(b"\n")):
+                    line = line.rstrip(b"\r")
+                    if not line or not any(n in line for n in needles):
+                        continue
+                    event = json_loads(line)
+                    if event["link_id"] == link_id and (step_id is None or event.get("step_id") == step_id):
+                        return event
+        return None
+
+    @staticmethod
+    def _link_needles(link_id: Optional[str]) -> set:
+        """
+        Byte-level prefilter for link_id: a line can only match if it contains
+        the JSON-encoded link ID (escaped or raw UTF-8, depending on the writer).
+        """
+        if link_id is None:
+            return set()
+        return {json.dumps(link_id).encode(), json.dumps(link_id, ensure_ascii=False).encode()}
@@ -1,10 +1,12 @@
 """CLI tool for scaffolding new DAWN projects from pipeline templates with input stubs."""
 import argparse
+import functools
 import os
 import yaml
 import json
 import time
 from pathlib import Path
+from dawn.runtime.fileio import json_loads, read_bytes
 
 MANIFEST_PATH = "dawn/pipelines/pipeline_manifest.json"
 
@@ -14,6 +16,9 @@ TEMPLATES = {
     "patch_approval.json": "{\n  \"decision\": \"PENDING\",\n  \"patchset_digest\": \"\",\n  \"instructions\": \"Set decision to APPROVED and paste the digest from the generated patchset.\"\n}",
 }
 
+# Templates encoded once at import
+_TEMPLATE_BYTES = {name: text.encode("utf-8") for name, text in TEMPLATES.items()}
+
 README_TEMPLATE = """# DAWN Project: {project_id}
 
 Pipeline: **{pipeline_id}** (v{version})
@@ -40,14 +45,43 @@ python3 -m dawn.runtime.inspect --project {project_id}
 ```
 """
 
+# Raw fd writes: the scaffold files are small and written once
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def _write_bytes(path, data):
+    """Write data to path through a raw descriptor, looping over short writes."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=8)
+def _load_manifest(path, mtime_ns):
+    """
+    Pipeline catalog entries keyed by pipeline ID.
+
+    Cached while the manifest is unchanged; mtime_ns is only part of the
+    cache key. The entries are shared and must not be mutated.
+    """
+    manifest = json_loads(read_bytes(path))
+    by_id = {}
+    for entry in manifest:
+        by_id.setdefault(entry["id"], entry)  # first entry wins on duplicate IDs
+    return by_id
+
 def load_pipeline_metadata(pipeline_id_or_path):
     """Load pipeline metadata from manifest or path."""
     # Check if it's a pipeline ID from the catalog
-    if os.path.exists(MANIFEST_PATH):
-        with open(MANIFEST_PATH, "r") as f:
-            manifest = json.load(f)
-        
-        entry = next((p for p in manifest if p["id"] == pipeline_id_or_path), None)
+    try:
+        manifest_mtime_ns = os.stat(MANIFEST_PATH).st_mtime_ns
+    except FileNotFoundError:
+        manifest_mtime_ns = None
+    if manifest_mtime_ns is not None:
+        entry = _load_manifest(MANIFEST_PATH, manifest_mtime_ns).get(pipeline_id_or_path)
         if entry:
             return entry, entry["path"]
     
@@ -68,9 +102,13 @@ def load_pipeline_metadata(pipeline_id_or_path):
 def bootstrap_project(project_id, pipeline, profile="normal", projects_dir="projects", metadata=None):
     """Bootstrap a new DAWN project with pipeline-aware templates."""
     project_root = Path(projects_dir) / project_id
-    if project_root.exists():
+    base = str(project_root)
+    try:
+        os.lstat(base)
         print(f"Error: Project directory {project_root} already exists.")
         return False
+    except FileNotFoundError:
+        pass
 
     print(f"Bootstrapping project '{project_id}'...")
     
@@ -81,9 +119,8 @@ def bootstrap_project(project_id, pipeline, profile="normal", projects_dir="proj
         return False
     
     # Create directories
-    dirs = ["inputs", "config", "docs", "src", "tests"]
-    for d in dirs:
-        (project_root / d).mkdir(parents=True, exist_ok=True)
+    for d in ("inputs", "config", "docs", "src", "tests"):
+        os.makedirs(os.path.join(base, d), exist_ok=True)
 
     # Write only required input templates based on pipeline
     required_inputs = pipeline_meta.get("required_inputs", [])
@@ -91,9 +128,8 @@ def bootstrap_project(project_id, pipeline, profile="normal", projects_dir="proj
     
     for inp in required_inputs:
         input_name = inp["name"]
-        if input_name in TEMPLATES:
-            with open(project_root / "inputs" / input_name, "w") as f:
-                f.write(TEMPLATES[input_name])
+        if input_name in _TEMPLATE_BYTES:
+            _write_bytes(os.path.join(base, "inputs", input_name), _TEMPLATE_BYTES[input_name])
             created_inputs.append(f"✓ {input_name}: {inp['description']}")
     
     # Generate deterministic next steps
@@ -117,8 +153,7 @@ def bootstrap_project(project_id, pipeline, profile="normal", projects_dir="proj
         next_steps="\n".join(next_steps)
     )
     
-    with open(project_root / "README.md", "w") as f:
-        f.write(readme_content)
+    _write_bytes(os.path.join(base, "README.md"), readme_content.encode("utf-8"))
 
     # Save project metadata for inference
     config_data = {
@@ -130,8 +165,7 @@ def bootstrap_project(project_id, pipeline, profile="normal", projects_dir="proj
     if metadata:
         config_data["metadata"] = metadata
 
-    with open(project_root / "config" / "project.json", "w") as f:
-        json.dump(config_data, f, indent=2)
+    _write_bytes(os.path.join(base, "config", "project.json"), json.dumps(config_data, indent=2).encode("utf-8"))
 
     # Update project index
     try:
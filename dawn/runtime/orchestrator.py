@@ -4,7 +4,10 @@ Phases 8.3-8.5: Resource Budgets, Observability, Isolation Mode
 """
 
 import yaml
+import bisect
+import copy
 import importlib.util
+import logging
 import os
 import uuid
 import json
@@ -13,12 +16,16 @@ import time
 import datetime
 import socket
 import threading
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
-from filelock import FileLock, Timeout
-from .registry import Registry
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple, Union
+from .registry import LinkSpec, Registry
 from .ledger import Ledger
 from .artifact_store import ArtifactStore
+from .project_lock import acquire as acquire_project_lock, LockTimeout
+from .fswatch import FsWatcher, INOTIFY_AVAILABLE
+from .fileio import json_dumps, json_dumps_compact, json_loads, read_bytes, write_bytes_atomic
 from ..policy import get_policy_loader, PolicyValidationError
 from .coherence import SimpleStructuralCoherenceProvider
 
@@ -29,6 +36,150 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Optional jsonschema for structural validation of outputs with a schema ref
+try:
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+
+
+def _project_size_bytes(root: Union[str, Path], limit: Optional[int] = None) -> int:
+    """
+    Total size of the files under root.
+
+    Iterative os.scandir walk: DirEntry answers the type checks from the
+    directory listing, so only files cost a stat. Symlinked directories are
+    not descended into. Stops as soon as the total exceeds limit, in which
+    case the returned value is a lower bound.
+    """
+    total = 0
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+                except OSError:
+                    continue
+        if limit is not None and total > limit:
+            break
+    return total
+
+
+_LOG = logging.getLogger(__name__)
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Input-signature hash (DAWN_SIGNATURE_ALGO). Ledger events record the algorithm
+# as signature_algo; events without it were signed with sha256 and are still
+# matched against a sha256 signature, so existing ledgers stay ALREADY_DONE
+SUPPORTED_SIGNATURE_ALGOS = ("blake2b", "sha256")
+
+
+# Key-sorted JSON encoders for signature hashing; stdlib on purpose so every
+# worker produces the same bytes. The legacy one matches json.dumps(sort_keys=True).
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+_LEGACY_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+def _hash_json(hasher, obj: Any, encoder: json.JSONEncoder = _CANONICAL_ENCODER):
+    """Feed obj's JSON encoding to hasher chunk by chunk, never building the whole document."""
+    for chunk in encoder.iterencode(obj):
+        hasher.update(chunk.encode("utf-8"))
+
+
+# Top-level project dirs whose writes the sandbox check always ignores
+_SANDBOX_UNWATCHED_DIRS = ("runs", "ledger")
+# System files that the orchestrator updates during link execution;
+# these should not trigger POLICY_VIOLATION
+_SANDBOX_IGNORED_FILES = frozenset({
+    "artifact_index.json", "project_index.json", "project_size.json", "artifacts/.digest_cache.json",
+    "pipeline.yaml", ".lock", "ligand.pool.json", "engram.registry.json", "striatum.habits.json",
+    "saga.narrative_identity.json",
+})
+_SANDBOX_IGNORED_PREFIXES = ("runs/", "ledger/")
+_SANDBOX_IGNORED_SUFFIXES = (".dawn_artifacts.json", ".shadow_artifacts.json",
+                             ".dawn_artifacts.jsonl", ".shadow_artifacts.jsonl")
+
+
+def _is_ignored_system_file(filepath: str) -> bool:
+    """Check if file is system metadata updated by orchestrator."""
+    return (
+        filepath in _SANDBOX_IGNORED_FILES  # root metadata files
+        # write_bytes_atomic temp files (<name>.<pid>.<thread>.<n>.tmp) of those,
+        # caught mid-write when links run concurrently
+        or (filepath.endswith(".tmp") and filepath.rsplit(".", 4)[0] in _SANDBOX_IGNORED_FILES)
+        or filepath.startswith(_SANDBOX_IGNORED_PREFIXES)  # logs and run data
+        # artifact registries and metrics (orchestrator updates these)
+        or filepath.endswith(_SANDBOX_IGNORED_SUFFIXES)
+        or "package.metrics" in filepath
+    )
+
+
+def _sorted_prefixes(prefixes: Iterable[str]) -> List[str]:
+    """
+    Sort prefixes, dropping any that extend another one in the list.
+
+    With no entry a prefix of another, the only entry that can be a prefix of
+    a path is its sorted predecessor, which _has_prefix finds by bisection.
+    """
+    kept: List[str] = []
+    for prefix in sorted(set(prefixes)):
+        if not kept or not prefix.startswith(kept[-1]):
+            kept.append(prefix)
+    return kept
+
+
+def _has_prefix(sorted_prefixes: List[str], path: str) -> bool:
+    """Whether path starts with an entry of a _sorted_prefixes() list."""
+    i = bisect.bisect_right(sorted_prefixes, path) - 1
+    return i >= 0 and path.startswith(sorted_prefixes[i])
+
+
+# Directories modified this recently are re-listed on every snapshot (coarse
+# filesystem timestamps can hide a second change in the same tick)
+_LISTING_RACY_NS = 2_000_000_000
+
+# project_size.json: running project size maintained across runs
+PROJECT_SIZE_FILENAME = "project_size.json"
+PROJECT_SIZE_VERSION = 1
+# Untracked writes (sandbox logs, link side files) drift the running size; re-walk every N runs
+PROJECT_SIZE_RESCAN_RUNS = 16
+# Files the orchestrator rewrites or appends to on every run; their growth is
+# measured by stat at preflight and after the run
+_PROJECT_SIZE_TRACKED = (
+    "artifact_index.json",
+    "pipeline.yaml",
+    "project_index.json",
+    PROJECT_SIZE_FILENAME,
+    os.path.join("ledger", "events.jsonl"),
+    os.path.join("artifacts", ".digest_cache.json"),
+    os.path.join("artifacts", "package.metrics", "run_summary.json"),
+)
+
+# Executed link run.py modules for the whole process, so each link is imported
+# once rather than once per Orchestrator; keyed by run.py path (link IDs repeat
+# across links dirs): abs path -> ((st_ino, st_mtime_ns, st_size), module)
+_LINK_MODULES: Dict[str, tuple] = {}
+_LINK_MODULES_LOCK = threading.Lock()
+
+# Concurrently running pipeline links when per_project.max_parallel_links is
+# unset; parallel scheduling is opt-in
+DEFAULT_MAX_PARALLEL_LINKS = 1
+# Phasic hooks that run around every pipeline link; their presence keeps the pipeline serial
+_SERIAL_HOOK_LINKS = ("striatum.gatekeeper", "striatum.accelerator", "pfc.simulate_outcome")
+
 
 class BudgetTimeoutError(Exception):
     """Raised when a link exceeds its wall time budget."""
@@ -70,6 +221,47 @@ class Orchestrator:
         self._last_pipeline_end_time = time.time()
         self._saga_running = False
 
+        self._signature_algo = os.environ.get("DAWN_SIGNATURE_ALGO", "blake2b").strip().lower()
+        if self._signature_algo not in SUPPORTED_SIGNATURE_ALGOS:
+            raise ValueError(
+                f"Unsupported DAWN_SIGNATURE_ALGO '{self._signature_algo}'; "
+                f"expected one of {SUPPORTED_SIGNATURE_ALGOS}"
+            )
+        # Compiled link conditions: condition string -> predicate over the context
+        self._condition_cache: Dict[str, Callable[[Dict], bool]] = {}
+
+        # Snapshot directory listings: abs dir -> (st_mtime_ns, subdir names, file names)
+        self._listing_cache: Dict[str, tuple] = {}
+
+        # Compiled jsonschema validators: schema ref -> validator
+        self._validator_cache: Dict[str, Any] = {}
+
+        # psutil handle for resource metrics (see _self_process)
+        self._process = None
+
+        # policy_versions dicts: (contract, policy version, policy digest, profile) -> dict
+        self._policy_versions_cache: Dict[tuple, Dict[str, str]] = {}
+
+        # Bundle SHA per bundle file: abs path -> ((st_mtime_ns, st_size), sha)
+        self._bundle_sha_cache: Dict[str, tuple] = {}
+        # run_summary pipeline digest per pipeline file, keyed the same way
+        self._pipeline_digest_cache: Dict[str, tuple] = {}
+
+        # Reused worker thread for link execution; replaced after a timeout
+        # strands its thread on a link that cannot be interrupted
+        self._link_executor: Optional[ThreadPoolExecutor] = None
+        self._link_executor_lock = threading.Lock()
+        # Worker count for the next link pool; raised while links run concurrently
+        self._link_workers = 1
+
+        # Parsed pipeline YAML, reused while the file's stat is unchanged:
+        # abs path -> ((st_mtime_ns, st_size), value)
+        self._yaml_cache: Dict[str, tuple] = {}
+
+        # Preflight project size per running project:
+        # project_id -> (size_bytes, epoch, tracked_bytes, store_delta)
+        self._project_size_marks: Dict[str, tuple] = {}
+
     def run_pipeline(self, project_id: str, pipeline_path: str, profile: Optional[str] = None):
         """Run a pipeline for a project. Acquires project lock."""
         project_root = self.projects_dir / project_id
@@ -83,11 +275,10 @@ class Orchestrator:
 
         # Acquire project lock to prevent concurrent execution
         lock_file = project_root / ".lock"
-        lock = FileLock(lock_file, timeout=0)
         lock_wait_start = time.time()
 
         try:
-            with lock:
+            with acquire_project_lock(lock_file, timeout=0):
                 lock_wait_time = time.time() - lock_wait_start
                 result = self._run_pipeline_locked(
                     project_id, pipeline_path, project_root,
@@ -95,21 +286,47 @@ class Orchestrator:
                 )
                 self._last_pipeline_end_time = time.time()
                 return result
-        except Timeout:
+        except LockTimeout:
             raise RuntimeError(f"Project {project_id} is currently locked by another process (BUSY)")
 
     def _run_pipeline_locked(self, project_id: str, pipeline_path: str, project_root: Path,
                               profile: str, lock_wait_time: float):
         """Internal pipeline execution with lock already acquired."""
+        ledger = Ledger(str(project_root))
+        artifact_store = ArtifactStore(str(project_root))
+        fs_watcher = self._start_fs_watcher(project_root)
+        try:
+            return self._run_pipeline_with_ledger(
+                project_id, pipeline_path, project_root, profile, lock_wait_time, ledger,
+                artifact_store, fs_watcher
+            )
+        finally:
+            if fs_watcher is not None:
+                fs_watcher.close()
+            # Buffered events must reach disk before the project lock is released
+            ledger.flush()
+            self._save_project_size(project_id, project_root, artifact_store)
+
+    @staticmethod
+    def _start_fs_watcher(project_root: Path) -> Optional[FsWatcher]:
+        """inotify watcher for sandbox checks, or None to use tree snapshots."""
+        if not INOTIFY_AVAILABLE:
+            return None
+        try:
+            return FsWatcher(project_root, skip_dirs=_SANDBOX_UNWATCHED_DIRS)
+        except OSError as e:
+            print(f"WARNING: inotify unavailable ({e}); using filesystem snapshots for sandbox checks")
+            return None
+
+    def _run_pipeline_with_ledger(self, project_id: str, pipeline_path: str, project_root: Path,
+                                  profile: str, lock_wait_time: float, ledger: Ledger,
+                                  artifact_store: ArtifactStore, fs_watcher: Optional[FsWatcher] = None):
+        """Pipeline execution body; ledger is flushed by the caller."""
         # Generate run-level identifiers (Phase 8.4.1)
         pipeline_run_id = str(uuid.uuid4())
         pipeline_start_time = time.time()
 
-        ledger = Ledger(str(project_root))
-        artifact_store = ArtifactStore(str(project_root))
-
-        with open(pipeline_path, "r") as f:
-            pipeline_config = yaml.safe_load(f)
+        pipeline_config = self._load_yaml_cached(pipeline_path)
 
         pipeline_id = pipeline_config.get("pipelineId", "default")
         links = pipeline_config.get("links", [])
@@ -125,16 +342,16 @@ class Orchestrator:
         print(f"Starting pipeline {pipeline_id} for project {project_id} [profile={profile}]")
 
         # Phase 8.3.1: Check per-project size budget BEFORE any link runs
-        project_size_check = self._check_project_size_budget(project_root, ledger, project_id, pipeline_id, pipeline_run_id)
+        project_size_check = self._check_project_size_budget(project_root, ledger, project_id, pipeline_id, pipeline_run_id,
+                                                             artifact_store)
         if project_size_check is not None:
             raise RuntimeError(project_size_check)
 
         # Load Artifact Index if exists
-        artifact_index = {}
-        index_path = project_root / "artifact_index.json"
-        if index_path.exists():
-            with open(index_path, "r") as f:
-                artifact_index = json.load(f)
+        try:
+            artifact_index = json_loads(read_bytes(project_root / "artifact_index.json"))
+        except FileNotFoundError:
+            artifact_index = {}
 
         # Build project context with run-level info
         project_context = {
@@ -146,6 +363,7 @@ class Orchestrator:
             "registry": self.registry,
             "ledger": ledger,
             "artifact_store": artifact_store,
+            "fs_watcher": fs_watcher,
             "artifact_index": artifact_index,
             "status_index": {},
             "profile": profile,
@@ -181,6 +399,13 @@ class Orchestrator:
 
         active_links = list(links)
         ptr = 0
+
+        # Independent links run concurrently; chains, hooked and routed pipelines stay serial
+        max_parallel = self._max_parallel_links()
+        dag = self._build_dag(links, overrides) if max_parallel > 1 else None
+        if dag is not None:
+            pipeline_failed, failure_link, failure_error = self._run_links_parallel(project_context, dag, max_parallel)
+            active_links = []
         while ptr < len(active_links):
             link_info = active_links[ptr]
             ptr += 1
@@ -192,35 +417,12 @@ class Orchestrator:
                 print(f"Error: Link {link_id} not found in registry")
                 continue
 
-            link_config = link_metadata["metadata"]
-            if link_id in overrides:
-                self._apply_overrides(link_config, overrides[link_id])
-
-            # Merge per-link config and overrides from pipeline YAML
-            if isinstance(link_info, dict):
-                if "config" in link_info:
-                    if "config" not in link_config:
-                        link_config["config"] = {}
-                    self._apply_overrides(link_config["config"], link_info["config"])
-                if "overrides" in link_info:
-                    self._apply_overrides(link_config, link_info["overrides"])
+            link_config = self._resolve_link_config(link_info, link_metadata, overrides)
 
             # Check 'when' conditions
-            when = link_config.get("spec", {}).get("when", {}).get("condition", "always")
+            when = self._link_spec(link_id, link_config).when_condition
             if not self._evaluate_condition(project_context, when, link_id):
-                print(f"Skipping link {link_id} due to condition: {when}")
-                ledger.log_event(
-                    project_id, pipeline_id, link_id, "",
-                    "evaluate_condition", "SKIPPED",
-                    metrics={"condition": when, "run_id": pipeline_run_id, "worker_id": self._worker_id}
-                )
-                ledger.log_event(
-                    project_id, pipeline_id, link_id, "",
-                    "link_complete", "SKIPPED",
-                    metrics={"condition": when, "run_id": pipeline_run_id, "worker_id": self._worker_id}
-                )
-                project_context["status_index"][link_id] = "SKIPPED"
-                project_context["link_durations"][link_id] = {"duration_ms": 0, "skipped": True, "reason": when}
+                self._skip_link(project_context, link_id, when)
                 continue
 
             # PHASIC HOOK: STRIATUM GATEKEEPER (Action Gating)
@@ -336,14 +538,14 @@ class Orchestrator:
         pipeline_end_time = time.time()
         pipeline_duration_ms = int((pipeline_end_time - pipeline_start_time) * 1000)
 
-        # Persist Artifact Index
-        index_path = project_root / "artifact_index.json"
-        with open(index_path, "w") as f:
-            json.dump(project_context["artifact_index"], f, indent=2)
+        # Persist Artifact Index (atomically, so a crash never leaves a torn index)
+        write_bytes_atomic(project_root / "artifact_index.json", json_dumps(project_context["artifact_index"]))
 
-        # Persist Pipeline YAML for introspection
-        with open(project_root / "pipeline.yaml", "w") as f:
-            yaml.dump(pipeline_config, f)
+        # Persist Pipeline YAML for introspection. Emitted by libyaml when
+        # available; JSON would not round-trip YAML scalars such as dates
+        # (orjson turns them into strings without complaint).
+        pipeline_data = yaml.dump(pipeline_config, Dumper=_YamlDumper).encode("utf-8")
+        write_bytes_atomic(project_root / "pipeline.yaml", pipeline_data)
 
         # Phase 8.4.2: Generate run_summary artifact
         self._generate_run_summary(
@@ -492,24 +694,45 @@ class Orchestrator:
         except Exception as e:
             print(f"Background synthesis failed: {e}")
         finally:
+            ledger.flush()
             self._saga_running = False
             self._last_pipeline_end_time = time.time()
 
     def _check_project_size_budget(self, project_root: Path, ledger: Ledger,
-                                    project_id: str, pipeline_id: str, run_id: str) -> Optional[str]:
-        """Phase 8.3.1: Check project size before any link runs."""
+                                    project_id: str, pipeline_id: str, run_id: str,
+                                    artifact_store: Optional[ArtifactStore] = None) -> Optional[str]:
+        """
+        Phase 8.3.1: Check project size before any link runs.
+
+        The size comes from project_size.json, which each run advances by the
+        bytes it registered, logged and wrote to its index files. The tree is walked when that file is
+        missing or from another version, every PROJECT_SIZE_RESCAN_RUNS runs,
+        or always with DAWN_VERIFY_PROJECT_SIZE=1. A stored size over the limit
+        is never trusted: files may have been deleted since, so the tree is
+        walked before failing.
+        """
         max_project_bytes = self.policy_loader.get_budget("per_project", "max_project_bytes")
         if not max_project_bytes:
             return None
 
-        # Calculate total project size
-        total_bytes = 0
-        for p in project_root.rglob("*"):
-            if p.is_file():
-                try:
-                    total_bytes += p.stat().st_size
-                except OSError:
-                    pass
+        total_bytes, epoch = None, 0
+        if os.environ.get("DAWN_VERIFY_PROJECT_SIZE") != "1":
+            try:
+                stored = json_loads(read_bytes(project_root / PROJECT_SIZE_FILENAME))
+                if (stored.get("version") == PROJECT_SIZE_VERSION
+                        and stored.get("epoch", 0) < PROJECT_SIZE_RESCAN_RUNS):
+                    total_bytes, epoch = int(stored["size_bytes"]), stored.get("epoch", 0)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                pass
+        if total_bytes is None or total_bytes > max_project_bytes:
+            epoch = 0
+            total_bytes = _project_size_bytes(project_root, max_project_bytes)
+
+        if total_bytes <= max_project_bytes and artifact_store is not None:
+            # Baseline for _save_project_size; the walk saw everything on disk so far
+            self._project_size_marks[project_id] = (
+                total_bytes, epoch, self._tracked_bytes(project_root), artifact_store.size_delta
+            )
 
         if total_bytes > max_project_bytes:
             error_msg = (
@@ -535,31 +758,334 @@ class Orchestrator:
 
         return None
 
+    @staticmethod
+    def _stat_key(path: Union[str, Path]) -> tuple:
+        """(abs path, (st_mtime_ns, st_size)) cache key for path."""
+        st = os.stat(path)
+        return os.path.abspath(path), (st.st_mtime_ns, st.st_size)
+
+    def _load_yaml_cached(self, path: Union[str, Path]) -> Any:
+        """
+        Parse a YAML file, reusing the parse while its stat is unchanged.
+
+        Returns a private deep copy, so callers may mutate the result.
+        """
+        key, signature = self._stat_key(path)
+        cached = self._yaml_cache.get(key)
+        if cached is None or cached[0] != signature:
+            with open(path, "rb") as f:
+                cached = (signature, yaml.load(f, Loader=_YamlLoader))
+            self._yaml_cache[key] = cached
+        return copy.deepcopy(cached[1])
+
+    def _load_link_module_cached(self, link_id: str, run_py_path: Path):
+        """
+        Import a link's run.py, reusing the executed module while the file is unchanged.
+
+        Modules are shared by every orchestrator in the process (see _LINK_MODULES).
+        """
+        st = os.stat(run_py_path)
+        key = os.path.abspath(run_py_path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _LINK_MODULES.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with _LINK_MODULES_LOCK:
+            cached = _LINK_MODULES.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            spec = importlib.util.spec_from_file_location(f"{link_id}.run", run_py_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _LINK_MODULES[key] = (signature, module)
+        return module
+
+    @staticmethod
+    def _tracked_bytes(project_root: Path) -> int:
+        """Combined size of the per-run orchestrator files (_PROJECT_SIZE_TRACKED)."""
+        total = 0
+        for name in _PROJECT_SIZE_TRACKED:
+            try:
+                total += os.stat(os.path.join(project_root, name)).st_size
+            except OSError:
+                pass
+        return total
+
+    def _save_project_size(self, project_id: str, project_root: Path, artifact_store: ArtifactStore):
+        """Advance project_size.json by this run's growth in tracked files and artifacts."""
+        marks = self._project_size_marks.pop(project_id, None)
+        if marks is None:
+            return
+        size_bytes, epoch, tracked_bytes, store_delta = marks
+        size_bytes += self._tracked_bytes(project_root) - tracked_bytes
+        size_bytes += artifact_store.size_delta - store_delta
+        try:
+            write_bytes_atomic(project_root / PROJECT_SIZE_FILENAME, json_dumps_compact({
+                "version": PROJECT_SIZE_VERSION,
+                "size_bytes": max(size_bytes, 0),
+                "epoch": epoch + 1,
+            }))
+        except OSError as e:
+            print(f"WARNING: Failed to persist project size: {e}")
+
     def _evaluate_condition(self, context: Dict, condition: str, link_id: str) -> bool:
-        if condition == "always":
-            return True
-        elif condition.startswith("on_success("):
+        """Evaluate a link's when: condition; each distinct string is parsed once."""
+        predicate = self._condition_cache.get(condition)
+        if predicate is None:
+            predicate = self._condition_cache[condition] = self._compile_condition(condition)
+        return predicate(context)
+
+    @staticmethod
+    def _compile_condition(condition: str) -> Callable[[Dict], bool]:
+        """Parse a condition string into a predicate; unknown conditions always hold."""
+        if condition.startswith("on_success("):
             target = condition[11:-1]
-            return context["status_index"].get(target) == "SUCCEEDED"
-        elif condition.startswith("on_failure("):
+            return lambda context: context["status_index"].get(target) == "SUCCEEDED"
+        if condition.startswith("on_failure("):
             target = condition[11:-1]
-            return context["status_index"].get(target) == "FAILED"
-        elif condition.startswith("if_artifact_exists("):
+            return lambda context: context["status_index"].get(target) == "FAILED"
+        if condition.startswith("if_artifact_exists("):
             target_artifact = condition[19:-1]
-            return target_artifact in context["artifact_index"]
-        return True
+            return lambda context: target_artifact in context["artifact_index"]
+        return lambda context: True  # "always" and unrecognised conditions
 
     def _apply_overrides(self, base: Dict, override: Dict):
-        for k, v in override.items():
-            if isinstance(v, dict) and k in base and isinstance(base[k], dict):
-                self._apply_overrides(base[k], v)
-            else:
-                base[k] = v
+        """Deep-merge override into base in place; nested dicts merge, anything else replaces."""
+        stack = [(base, override)]
+        while stack:
+            b, o = stack.pop()
+            for k, v in o.items():
+                if isinstance(v, dict) and isinstance(b.get(k), dict):
+                    stack.append((b[k], v))
+                else:
+                    b[k] = v
+
+    def _resolve_link_config(self, link_info: Union[str, Dict], link_metadata: Dict, overrides: Dict) -> Dict:
+        """Apply pipeline-level overrides and the link entry's config/overrides to its metadata."""
+        link_id = link_info if isinstance(link_info, str) else link_info.get("id")
+        link_config = link_metadata["metadata"]
+        if link_id in overrides:
+            self._apply_overrides(link_config, overrides[link_id])
+
+        # Merge per-link config and overrides from pipeline YAML
+        if isinstance(link_info, dict):
+            if "config" in link_info:
+                if "config" not in link_config:
+                    link_config["config"] = {}
+                self._apply_overrides(link_config["config"], link_info["config"])
+            if "overrides" in link_info:
+                self._apply_overrides(link_config, link_info["overrides"])
+        if link_id in overrides or isinstance(link_info, dict):
+            self.registry.invalidate_link_spec(link_id)
+        return link_config
+
+    def _link_spec(self, link_id: str, link_config: Dict) -> LinkSpec:
+        """Resolved spec fields of link_config; memoized when it is the registry's own metadata."""
+        link = self.registry.get_link(link_id)
+        if link is not None and link["metadata"] is link_config:
+            return self.registry.get_link_spec(link_id)
+        return LinkSpec.from_config(link_config)
+
+    def _skip_link(self, context: Dict, link_id: str, when: str):
+        """Record a link whose when: condition does not hold."""
+        print(f"Skipping link {link_id} due to condition: {when}")
+        metrics = {"condition": when, "run_id": context["pipeline_run_id"], "worker_id": self._worker_id}
+        for step_id in ("evaluate_condition", "link_complete"):
+            context["ledger"].log_event(
+                context["project_id"], context["pipeline_id"], link_id, "",
+                step_id, "SKIPPED", metrics=dict(metrics)
+            )
+        context["status_index"][link_id] = "SKIPPED"
+        context["link_durations"][link_id] = {"duration_ms": 0, "skipped": True, "reason": when}
+
+    def _max_parallel_links(self) -> int:
+        """Upper bound on concurrently running links (per_project.max_parallel_links)."""
+        return int(self.policy_loader.get_budget("per_project", "max_parallel_links") or DEFAULT_MAX_PARALLEL_LINKS)
+
+    def _build_dag(self, links: List, overrides: Dict) -> Optional[Dict[str, Any]]:
+        """
+        Derive the link dependency graph for concurrent scheduling.
+
+        A link depends on the earlier links its when: condition names and on the
+        earlier producers of the artifacts it requires, so the pipeline order is
+        always a valid schedule. Returns None when the pipeline has to run
+        serially: phasic hooks or shadows are involved, a thalamus link may
+        hot-swap the remaining links, a link repeats, or the graph is a chain.
+        """
+        if any(self.registry.get_link(hook_id) for hook_id in _SERIAL_HOOK_LINKS):
+            return None
+        link_ids = []
+        for link_info in links:
+            link_id = link_info if isinstance(link_info, str) else link_info.get("id")
+            if isinstance(link_info, dict) and (
+                "shadow" in link_info or link_info.get("config", {}).get("execution_mode") == "shadow"
+            ):
+                return None
+            if link_id.startswith("thalamus.") or link_id in link_ids:
+                return None
+            link_ids.append(link_id)
+
+        order, entries, deps = [], {}, {}
+        producers = {}  # artifact ID -> last earlier link producing it
+        for link_info, link_id in zip(links, link_ids):
+            link_metadata = self.registry.get_link(link_id)
+            if not link_metadata:
+                print(f"Error: Link {link_id} not found in registry")
+                continue
+            link_config = self._resolve_link_config(link_info, link_metadata, overrides)
+            link_spec = self._link_spec(link_id, link_config)
+
+            link_deps = set()
+            when = link_spec.when_condition
+            if when.startswith(("on_success(", "on_failure(")):
+                link_deps.add(when[11:-1])
+            elif when.startswith("if_artifact_exists("):
+                link_deps.add(producers.get(when[19:-1]))
+            for req in link_spec.requires:
+                art_id = req.get("artifactId") or req.get("artifact")
+                link_deps.add(req.get("from_link") or producers.get(art_id))
+
+            deps[link_id] = {dep for dep in link_deps if dep in entries}
+            entries[link_id] = (link_metadata["path"], link_config, when)
+            order.append(link_id)
+            for prod in link_spec.produces:
+                producers[prod.get("artifactId") or prod.get("artifact")] = link_id
+
+        if all(prev in deps[link_id] for prev, link_id in zip(order, order[1:])):
+            return None
+        return {"order": order, "links": entries, "deps": deps}
+
+    def _run_links_parallel(self, context: Dict, dag: Dict[str, Any], max_workers: int) -> tuple:
+        """
+        Run the links of a _build_dag graph, each as soon as its dependencies finish.
+
+        Ready links start in pipeline order, at most max_workers at a time. After
+        the first failure nothing new starts; links already running finish.
+        Returns (pipeline_failed, failure_link, failure_error).
+        """
+        position = {link_id: i for i, link_id in enumerate(dag["order"])}
+        waiting = {link_id: set(deps) for link_id, deps in dag["deps"].items()}
+        dependents: Dict[str, List[str]] = {}
+        for link_id, deps in waiting.items():
+            for dep in deps:
+                dependents.setdefault(dep, []).append(link_id)
+
+        self._grow_link_executor(max_workers)
+        status_lock = threading.Lock()
+        # Links currently executing, and per link every link that ran at the
+        # same time as it at some point (both guarded by status_lock)
+        active: set = set()
+        overlaps: Dict[str, set] = {}
+        ready = [link_id for link_id in dag["order"] if not waiting[link_id]]
+        running = {}
+        failure = None
+
+        def finished(link_id: str):
+            for dependent in dependents.get(link_id, ()):
+                waiting[dependent].discard(link_id)
+                if not waiting[dependent]:
+                    ready.append(dependent)
+            ready.sort(key=position.__getitem__)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dawn-sched") as pool:
+            while running or (ready and failure is None):
+                while ready and failure is None and len(running) < max_workers:
+                    link_id = ready.pop(0)
+                    link_path, link_config, when = dag["links"][link_id]
+                    if not self._evaluate_condition(context, when, link_id):
+                        with status_lock:
+                            self._skip_link(context, link_id, when)
+                        finished(link_id)
+                        continue
+                    future = pool.submit(self._run_scheduled_link, context, link_id, link_path, link_config,
+                                         active, overlaps, status_lock)
+                    running[future] = link_id
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: position[running[f]]):
+                    link_id = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        if failure is None:
+                            failure = (link_id, str(error))
+                        continue
+                    finished(link_id)
+
+        if failure is None:
+            return False, None, None
+        return True, failure[0], failure[1]
+
+    def _run_scheduled_link(self, context: Dict, link_id: str, link_path: str, link_config: Dict,
+                            active: set, overlaps: Dict[str, set], status_lock: threading.Lock):
+        """Run one link for _run_links_parallel and record its status and duration."""
+        # Links get their own context so each sees its own sandbox. The shared
+        # watcher cannot attribute writes between overlapping links, so leak
+        # detection falls back to snapshots, and writes by links that ran at the
+        # same time into their own artifact dirs are not held against this one.
+        with status_lock:
+            overlaps[link_id] = set(active)
+            for other_link_id in active:
+                overlaps[other_link_id].add(link_id)
+            active.add(link_id)
+        link_context = dict(context, fs_watcher=None, concurrent_links=overlaps[link_id],
+                            concurrent_links_lock=status_lock)
+        link_start = time.time()
+        try:
+            self._execute_link(link_context, link_id, link_path, link_config)
+        except Exception as e:
+            with status_lock:
+                active.discard(link_id)
+                context["status_index"][link_id] = "FAILED"
+                context["link_durations"][link_id] = {
+                    "duration_ms": int((time.time() - link_start) * 1000),
+                    "skipped": False,
+                    "error": str(e)
+                }
+            raise
+        with status_lock:
+            active.discard(link_id)
+            if context["status_index"].get(link_id) not in ["SKIPPED", "INHIBITED"]:
+                context["status_index"][link_id] = "SUCCEEDED"
+                context["link_durations"][link_id] = {
+                    "duration_ms": int((time.time() - link_start) * 1000),
+                    "skipped": False
+                }
+
+    def _policy_versions(self, contract_version: str, profile: str) -> Dict[str, str]:
+        """policy_versions stamped on a link's ledger events; shared between links, do not mutate."""
+        key = (contract_version, self.policy_loader.version, self.policy_loader.digest, profile)
+        versions = self._policy_versions_cache.get(key)
+        if versions is None:
+            versions = self._policy_versions_cache[key] = {
+                "contractVersion": contract_version,
+                "policyVersion": key[1],
+                "policyDigest": key[2],
+                "profile": profile
+            }
+        return versions
+
+    def _self_process(self) -> Optional["psutil.Process"]:
+        """psutil handle for this process, created once (again after a fork)."""
+        if not PSUTIL_AVAILABLE:
+            return None
+        pid = os.getpid()
+        if self._process is None or self._process.pid != pid:
+            try:
+                self._process = psutil.Process(pid)
+            except Exception:
+                return None
+        return self._process
 
     def _get_strict_mode(self) -> bool:
         return os.environ.get("DAWN_STRICT_ARTIFACT_ID") == "1"
 
     def _execute_link(self, context: Dict, link_id: str, link_path: str, link_config: Dict, is_shadow: bool = False, always_run: bool = False):
+        """Execute a single link; its ledger events are appended together when it finishes."""
+        with context["ledger"].batch():
+            return self._run_link(context, link_id, link_path, link_config, is_shadow, always_run)
+
+    def _run_link(self, context: Dict, link_id: str, link_path: str, link_config: Dict, is_shadow: bool = False, always_run: bool = False):
         # LIGAND: Check for Inhibition Artifact (Soft Kill)
         if context["artifact_store"].get("ligand.inhibition") and not link_id.startswith(("striatum.", "acc.", "pfc.")):
             print(f"LIGAND: Link {link_id} inhibited by Soft Kill. Skipping.")
@@ -578,43 +1104,32 @@ class Orchestrator:
         run_id = str(uuid.uuid4())
         profile = context.get("profile", "normal")
 
-        policy_versions = {
-            "contractVersion": link_config.get("contractVersion", "1.0.0"),
-            "policyVersion": self.policy_loader.version,
-            "policyDigest": self.policy_loader.digest,
-            "profile": profile
-        }
+        link_spec = self._link_spec(link_id, link_config)
+        policy_versions = self._policy_versions(link_spec.contract_version, profile)
         strict_mode = self._get_strict_mode()
 
         # 1. Calculate Input Signature for Idempotency
         input_signature = self._calculate_input_signature(context, link_id, link_path, link_config)
 
-        # Check for alwaysRun flag (ground truth links that should never skip)
-        # Check for always_run flag (ground truth links that should never skip)
-        spec = link_config.get("spec", {})
-        runtime = spec.get("runtime", {})
-        always_run = (
-            always_run or 
-            spec.get("always_run", False) or 
-            spec.get("alwaysRun", False) or 
-            runtime.get("always_run", False) or 
-            runtime.get("alwaysRun", False)
-        )
+        # Check for always_run/alwaysRun flag (ground truth links that should never skip)
+        always_run = always_run or link_spec.always_run
         
         # Check if already done (unless alwaysRun is set)
         should_skip = False
         skip_reason = None
         
         if not always_run:
-            previous_events = context["ledger"].get_events(link_id)
-            last_complete = None
-            for ev in reversed(previous_events):
-                if ev.get("step_id") == "link_complete":
-                    last_complete = ev
-                    break
+            last_complete = context["ledger"].get_last_event(link_id, "link_complete")
 
             if last_complete and last_complete.get("status") == "SUCCEEDED":
-                if last_complete.get("metrics", {}).get("input_signature") == input_signature:
+                last_metrics = last_complete.get("metrics", {})
+                last_algo = last_metrics.get("signature_algo", "sha256")
+                expected_signature = input_signature
+                if last_algo != self._signature_algo and last_algo in SUPPORTED_SIGNATURE_ALGOS:
+                    expected_signature = self._calculate_input_signature(
+                        context, link_id, link_path, link_config, algo=last_algo
+                    )
+                if last_metrics.get("input_signature") == expected_signature:
                     should_skip = True
                     skip_reason = "ALREADY_DONE"
             else:
@@ -628,8 +1143,7 @@ class Orchestrator:
                 rehydrated_count = context["artifact_store"].rehydrate_from_link_dir(link_id, is_shadow=is_shadow)
                 
                 # Verify rehydration for links with produces
-                produces = link_config.get("spec", {}).get("produces", [])
-                required_artifacts = [p for p in produces if not p.get("optional", False)]
+                required_artifacts = [p for p in link_spec.produces if not p.get("optional", False)]
                 
                 if required_artifacts and rehydrated_count == 0:
                     error_msg = (
@@ -667,6 +1181,7 @@ class Orchestrator:
             status="STARTED",
             metrics={
                 "input_signature": input_signature,
+                "signature_algo": self._signature_algo,
                 "run_id": context["pipeline_run_id"],
                 "worker_id": self._worker_id
             },
@@ -681,9 +1196,7 @@ class Orchestrator:
 
             # 2. Run Link with timeout (Phase 8.3.2)
             run_py_path = Path(link_path) / "run.py"
-            spec = importlib.util.spec_from_file_location(f"{link_id}.run", run_py_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            module = self._load_link_module_cached(link_id, run_py_path)
 
             # Inject Sandbox helper into context
             from .sandbox import Sandbox
@@ -691,41 +1204,65 @@ class Orchestrator:
             sandbox.artifact_store = context["artifact_store"]  # Enable artifact registration
             context["sandbox"] = sandbox
 
-            # Snapshot filesystem state for best-effort leak detection
-            pre_run_files = self._get_fs_snapshot(context["project_root"])
+            # Snapshot filesystem state for best-effort leak detection; with a
+            # watcher only the paths written while the link runs are collected
+            fs_watcher = context.get("fs_watcher")
+            if fs_watcher is not None:
+                fs_watcher.changed()  # drop writes made before this link
+                pre_run_snapshot = None
+            else:
+                pre_run_snapshot = self._get_fs_snapshot(context["project_root"])
+            link_started_ns = time.time_ns()
 
             # Get effective timeout based on profile, with per-link override support
-            timeout_sec = link_config.get("max_wall_time_sec") or self.policy_loader.get_effective_timeout(profile)
+            timeout_sec = link_spec.max_wall_time_sec or self.policy_loader.get_effective_timeout(profile)
 
             # Track resource usage (best-effort)
             resource_metrics = {"cpu_sec": "unavailable", "mem_mb_peak": "unavailable"}
+            proc = self._self_process()
+            cpu_before = None
+            if proc is not None:
+                try:
+                    cpu_before = proc.cpu_times()
+                except Exception:
+                    pass
 
             # Execute with timeout
             result = self._execute_with_timeout(module, context, link_config, timeout_sec, link_id, run_id, policy_versions)
-            print(f"[DEBUG] After _execute_with_timeout for {link_id}: type={type(result)}, is_dict={isinstance(result, dict)}")
+            _LOG.debug("After _execute_with_timeout for %s: is_dict=%s", link_id, isinstance(result, dict))
 
             # Best-effort resource tracking (Phase 8.3.4)
-            if PSUTIL_AVAILABLE:
+            # cpu_sec is the process CPU time spent while the link ran
+            if cpu_before is not None:
                 try:
-                    proc = psutil.Process(os.getpid())
                     cpu_times = proc.cpu_times()
-                    resource_metrics["cpu_sec"] = cpu_times.user + cpu_times.system
+                    resource_metrics["cpu_sec"] = (
+                        (cpu_times.user - cpu_before.user) + (cpu_times.system - cpu_before.system)
+                    )
                     resource_metrics["mem_mb_peak"] = proc.memory_info().rss / (1024 * 1024)
                 except Exception:
                     pass
 
             # Post-run Scan: Detect leaks outside allowed roots (Profile-aware - Phase 8.5)
-            post_run_files = self._get_fs_snapshot(context["project_root"])
+            touched = fs_watcher.changed() if fs_watcher is not None else None
+            if touched is not None:
+                changed_files = sorted(touched)
+            else:
+                post_paths, post_mtimes = self._get_fs_snapshot(context["project_root"])
+                if pre_run_snapshot is not None:
+                    changed_files = self._diff_fs_snapshots(pre_run_snapshot, (post_paths, post_mtimes))
+                else:
+                    # Watcher lost events: anything modified since the link started counts
+                    changed_files = [p for p, m in zip(post_paths, post_mtimes) if m >= link_started_ns]
             self._check_sandbox_violations(
                 context, link_id, run_id, policy_versions, profile,
-                pre_run_files, post_run_files, is_shadow=is_shadow
+                changed_files, is_shadow=is_shadow
             )
 
             # Phase 8.3.3: Check output size budget AFTER link runs
             self._check_output_size_budget(context, link_id, run_id, policy_versions)
 
             # 3. Handle Link Result
-            print(f"[DEBUG] About to call result.get() for {link_id}: type={type(result)}")
             link_status = result.get("status", "SUCCEEDED")
             if link_status == "FAILED":
                 failure_info = result.get("errors", {})
@@ -748,7 +1285,6 @@ class Orchestrator:
                 raise Exception(error_msg)
 
             # 4. Validate Outputs (Contract Enforcement - After)
-            print(f"[DEBUG] About to call _validate_outputs for {link_id}: link_config type={type(link_config)}")
             try:
                 outputs = self._validate_outputs(
                     context, link_id, link_config, run_id, policy_versions, strict_mode, profile
@@ -770,7 +1306,7 @@ class Orchestrator:
                 context["artifact_index"].update(outputs)
 
             # Phase 2.1: Entropy Monitor (Coherence Check)
-            coherence_policy = link_config.get("spec", {}).get("coherence_policy")
+            coherence_policy = link_spec.coherence_policy
             if coherence_policy:
                 # Run coherence check (Shadows also check coherence)
                 score = self._check_coherence(context, link_id, outputs, coherence_policy)
@@ -778,6 +1314,7 @@ class Orchestrator:
             # Finalize ledger for this link
             metrics = result.get("metrics", {})
             metrics["input_signature"] = input_signature
+            metrics["signature_algo"] = self._signature_algo
             metrics["run_id"] = context["pipeline_run_id"]
             metrics["worker_id"] = self._worker_id
             metrics.update(resource_metrics)
@@ -873,7 +1410,8 @@ class Orchestrator:
     def _validate_inputs(self, context: Dict, link_id: str, link_config: Dict,
                          run_id: str, policy_versions: Dict, strict_mode: bool):
         """Validate required inputs exist before link execution."""
-        requires = link_config.get("spec", {}).get("requires", [])
+        requires = self._link_spec(link_id, link_config).requires
+        hydrate = []
         
         for req in requires:
             norm = self._normalize_artifact_spec(req)
@@ -899,12 +1437,12 @@ class Orchestrator:
             if index_entry and index_entry.get("path"):
                 artifact_path = Path(index_entry["path"])
                 if artifact_path.exists():
-                    context["artifact_store"].register(
-                        artifact_id=artifact_id,
-                        abs_path=str(artifact_path.absolute()),
-                        schema=norm.get("schema"),
-                        producer_link_id=index_entry.get("link_id") or index_entry.get("producer_link_id")
-                    )
+                    hydrate.append({
+                        "artifact_id": artifact_id,
+                        "abs_path": str(artifact_path.absolute()),
+                        "schema": norm.get("schema"),
+                        "producer_link_id": index_entry.get("link_id") or index_entry.get("producer_link_id")
+                    })
                     continue
             
             # Not in registry - check if optional
@@ -919,28 +1457,25 @@ class Orchestrator:
             self._log_validation_error(context, link_id, run_id, "validate_inputs", error_msg, policy_versions)
             raise Exception(error_msg)
 
+        # Inputs hydrated from artifact_index are hashed together
+        context["artifact_store"].register_batch(hydrate)
+
     def _execute_with_timeout(self, module, context: Dict, link_config: Dict,
                                timeout_sec: int, link_id: str, run_id: str,
                                policy_versions: Dict) -> Dict:
         """Execute link with wall-clock timeout enforcement (Phase 8.3.2)."""
-        result = {}
-        exception_holder = [None]
+        # Links may read ledger/events.jsonl directly; put buffered events on disk first
+        context["ledger"].flush()
 
-        def run_link():
-            """Run link."""
-            nonlocal result
-            try:
-                result = module.run(context, link_config)
-                print(f"[DEBUG] Link {link_id} returned: type={type(result)}, value={result if isinstance(result, dict) else repr(result)[:200]}")
-            except Exception as e:
-                exception_holder[0] = e
-
-        thread = threading.Thread(target=run_link)
-        thread.start()
-        thread.join(timeout=timeout_sec)
+        executor = self._get_link_executor()
+        future = executor.submit(self._call_link, module, context, link_config, link_id)
+        try:
+            result = future.result(timeout=timeout_sec)
+        except FutureTimeoutError:
+            # The worker is stuck in the link; abandon it and start a fresh one
+            future.cancel()
+            self._discard_link_executor(executor)
 
-        if thread.is_alive():
-            # Timeout occurred - thread is still running
             # Log the timeout and raise
             error_msg = f"BUDGET_TIMEOUT: Link {link_id} exceeded wall time limit of {timeout_sec}s"
             context["ledger"].log_event(
@@ -962,17 +1497,52 @@ class Orchestrator:
             exc._logged = True
             raise exc
 
-        if exception_holder[0] is not None:
-            raise exception_holder[0]
-
-        print(f"[DEBUG] _execute_with_timeout returning: type={type(result)}, keys={result.keys() if isinstance(result, dict) else 'NOT_A_DICT'}")
         return result or {"status": "SUCCEEDED"}
 
+    @staticmethod
+    def _call_link(module, context: Dict, link_config: Dict, link_id: str):
+        """Run a link module on the link worker thread."""
+        result = module.run(context, link_config)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Link %s returned: type=%s, value=%s", link_id, type(result).__name__,
+                       result if isinstance(result, dict) else repr(result)[:200])
+        return result
+
+    def _get_link_executor(self) -> ThreadPoolExecutor:
+        """The link worker pool, created on first use."""
+        with self._link_executor_lock:
+            if self._link_executor is None:
+                self._link_executor = ThreadPoolExecutor(max_workers=self._link_workers, thread_name_prefix="dawn-link")
+            return self._link_executor
+
+    def _grow_link_executor(self, workers: int):
+        """Make room for workers links at once; a smaller idle pool is replaced."""
+        with self._link_executor_lock:
+            if self._link_workers >= workers:
+                return
+            self._link_workers = workers
+            stale, self._link_executor = self._link_executor, None
+        if stale is not None:
+            stale.shutdown(wait=False)
+
+    def _discard_link_executor(self, executor: ThreadPoolExecutor):
+        """Drop a pool whose worker timed out; the next link gets a new one."""
+        with self._link_executor_lock:
+            if self._link_executor is executor:
+                self._link_executor = None
+        executor.shutdown(wait=False)
+
     def _check_sandbox_violations(self, context: Dict, link_id: str, run_id: str,
                                    policy_versions: Dict, profile: str,
-                                   pre_run_files: Dict, post_run_files: Dict,
+                                   changed_files: Iterable[str],
                                    is_shadow: bool = False):
-        """Check for unauthorized file writes (Profile-aware - Phase 8.5)."""
+        """
+        Check for unauthorized file writes (Profile-aware - Phase 8.5).
+
+        changed_files are the project-relative paths created or modified by the link.
+        """
+        if not changed_files:
+            return
         leaks = []
 
         # Build allowed prefixes based on profile
@@ -987,6 +1557,14 @@ class Orchestrator:
         if is_shadow:
             allowed_prefixes.append(os.path.join("shadow_artifacts", link_id))
 
+        # Links that ran alongside this one wrote their own artifact dirs meanwhile
+        concurrent_links_lock = context.get("concurrent_links_lock")
+        if concurrent_links_lock is not None:
+            with concurrent_links_lock:
+                concurrent_links = list(context["concurrent_links"])
+            for other_link_id in concurrent_links:
+                allowed_prefixes.append(os.path.join("artifacts", other_link_id))
+
         # Phase 8.5: In isolation mode, src/ writes are ALWAYS blocked
         profile_config = self.policy_loader.get_profile(profile)
         for root in profile_config.get("allowed_write_roots", []) or []:
@@ -1003,35 +1581,19 @@ class Orchestrator:
             # (already the case without src/)
             pass
 
-        # System files that the orchestrator updates during link execution
-        # These should not trigger POLICY_VIOLATION
-        def is_ignored_system_file(filepath):
-            """Check if file is system metadata updated by orchestrator."""
-            # Ignore root metadata files
-            if filepath in {"artifact_index.json", "project_index.json", "pipeline.yaml", ".lock", "ligand.pool.json", "engram.registry.json", "striatum.habits.json", "saga.narrative_identity.json"}:
-                return True
-            # Ignore logs and run data
-            if filepath.startswith("runs/") or filepath.startswith("ledger/"):
-                return True
-            # Ignore artifact registries and metrics (orchestrator updates these)
-            if filepath.endswith(".dawn_artifacts.json") or filepath.endswith(".shadow_artifacts.json") or "package.metrics" in filepath:
-                return True
-            return False
-        
-        for path, mtime in post_run_files.items():
+        # One bisect and one startswith per path
+        allowed = _sorted_prefixes(allowed_prefixes)
+        for path in changed_files:
             # Ignore common ephemeral files
             if "__pycache__" in path or path.endswith(".pyc"):
                 continue
             
             # Ignore system metadata files updated by orchestrator
-            if is_ignored_system_file(path):
+            if _is_ignored_system_file(path):
                 continue
 
-            is_allowed = any(path.startswith(prefix) for prefix in allowed_prefixes)
-
-            if not is_allowed:
-                if path not in pre_run_files or post_run_files[path] != pre_run_files.get(path):
-                    leaks.append(path)
+            if not _has_prefix(allowed, path):
+                leaks.append(path)
 
         if leaks:
             error_msg = f"POLICY_VIOLATION: Link {link_id} modified files outside allowed sandbox roots: {leaks}"
@@ -1057,18 +1619,8 @@ class Orchestrator:
         if not max_output_bytes:
             return
 
-        # Calculate total size of link's output directory
-        output_dir = Path(context["project_root"]) / "artifacts" / link_id
-        if not output_dir.exists():
-            return
-
-        total_bytes = 0
-        for p in output_dir.rglob("*"):
-            if p.is_file():
-                try:
-                    total_bytes += p.stat().st_size
-                except OSError:
-                    pass
+        # Calculate total size of link's output directory (0 if it does not exist)
+        total_bytes = _project_size_bytes(os.path.join(context["project_root"], "artifacts", link_id))
 
         if total_bytes > max_output_bytes:
             error_msg = (
@@ -1110,9 +1662,27 @@ class Orchestrator:
             print(f"[ERROR] _validate_outputs received link_config as {type(link_config)}, expected dict")
             link_config = {}
         
-        produces = link_config.get("spec", {}).get("produces", [])
+        produces = self._link_spec(link_id, link_config).produces
         outputs_resolved = {}
 
+        # Auto-register unpublished outputs found at their legacy contract
+        # path in one batch, so their files are hashed concurrently.
+        legacy_batch = []
+        for prod in produces:
+            norm = self._normalize_artifact_spec(prod)
+            artifact_id = norm["artifact_id"]
+            if artifact_id and norm["path"] and not context["artifact_store"].get(artifact_id):
+                file_path = Path(context["project_root"]) / "artifacts" / link_id / norm["path"]
+                if file_path.exists():
+                    legacy_batch.append({
+                        "artifact_id": artifact_id,
+                        "abs_path": str(file_path.absolute()),
+                        "schema": norm["schema"],
+                        "producer_link_id": link_id
+                    })
+        context["artifact_store"].register_batch(legacy_batch)
+        legacy_ids = {r["artifact_id"] for r in legacy_batch}
+
         for prod in produces:
             norm = self._normalize_artifact_spec(prod)
             artifact_id = norm["artifact_id"]
@@ -1123,7 +1693,7 @@ class Orchestrator:
             # Check if artifact was registered during link execution
             artifact_meta = context["artifact_store"].get(artifact_id)
             
-            if artifact_meta:
+            if artifact_meta and artifact_id not in legacy_ids:
                 # Registered via sandbox.publish - validate it exists
                 artifact_path = Path(artifact_meta["path"])
                 if not artifact_path.exists():
@@ -1137,16 +1707,8 @@ class Orchestrator:
             
             # Not registered - check if path was provided for legacy support
             if norm["path"]:
-                file_path = Path(context["project_root"]) / "artifacts" / link_id / norm["path"]
-                if file_path.exists():
-                    # Auto-register for this run
-                    context["artifact_store"].register(
-                        artifact_id=artifact_id,
-                        abs_path=str(file_path.absolute()),
-                        schema=norm["schema"],
-                        producer_link_id=link_id
-                    )
-                    artifact_meta = context["artifact_store"].get(artifact_id)
+                if artifact_id in legacy_ids:
+                    # Auto-registered for this run above
                     outputs_resolved[artifact_id] = artifact_meta
                     
                     # Continue with schema validation below
@@ -1186,8 +1748,7 @@ class Orchestrator:
             
             if schema.get("type") == "json":
                 try:
-                    with open(file_path, "r") as f:
-                        artifact_data = json.load(f)
+                    artifact_data = json_loads(read_bytes(file_path))
                 except Exception as e:
                     error_msg = f"SCHEMA_INVALID: {artifact_id} is not valid JSON. {str(e)}"
                     context["ledger"].log_event(
@@ -1205,8 +1766,9 @@ class Orchestrator:
                     target_schema = SCHEMA_REGISTRY.get(schema_ref)
                     if target_schema:
                         try:
-                            from jsonschema import validate
-                            validate(instance=artifact_data, schema=target_schema)
+                            error = best_match(self._schema_validator(schema_ref, target_schema).iter_errors(artifact_data))
+                            if error is not None:
+                                raise error
                         except Exception as ve:
                             error_msg = f"SCHEMA_INVALID: {artifact_id} failed validation against '{schema_ref}': {str(ve)}"
                             context["ledger"].log_event(
@@ -1231,6 +1793,17 @@ class Orchestrator:
 
         return outputs_resolved
 
+    def _schema_validator(self, schema_ref: str, schema: Dict):
+        """Checked and compiled validator for a registry schema, built once per schema_ref."""
+        if not JSONSCHEMA_AVAILABLE:
+            raise ImportError("jsonschema is required to validate outputs against a schema ref")
+        validator = self._validator_cache.get(schema_ref)
+        if validator is None:
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = self._validator_cache[schema_ref] = cls(schema)
+        return validator
+
     def _generate_run_summary(self, context: Dict, project_root: Path,
                                pipeline_path: str, start_time: float, end_time: float,
                                duration_ms: int, failed: bool, failure_link: Optional[str],
@@ -1238,8 +1811,7 @@ class Orchestrator:
         """Phase 8.4.2: Generate dawn.metrics.run_summary artifact."""
         # Compute pipeline digest
         try:
-            with open(pipeline_path, "rb") as f:
-                pipeline_digest = hashlib.sha256(f.read()).hexdigest()
+            pipeline_digest = self._pipeline_digest(pipeline_path)
         except Exception:
             pipeline_digest = "unknown"
 
@@ -1284,8 +1856,7 @@ class Orchestrator:
         metrics_dir.mkdir(parents=True, exist_ok=True)
         summary_path = metrics_dir / "run_summary.json"
 
-        with open(summary_path, "w") as f:
-            json.dump(summary, f, indent=2)
+        write_bytes_atomic(summary_path, json_dumps(summary))
 
         # Register in artifact index
         digest = context["artifact_store"].get_digest(summary_path)
@@ -1295,7 +1866,25 @@ class Orchestrator:
             "link_id": "package.metrics"
         }
 
-    def _calculate_input_signature(self, context: Dict, link_id: str, link_path: str, link_config: Dict) -> str:
+    def _pipeline_digest(self, pipeline_path: str) -> str:
+        """sha256 of the pipeline file, re-hashed only when its stat changes."""
+        key, signature = self._stat_key(pipeline_path)
+        cached = self._pipeline_digest_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(pipeline_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                h = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+                digest = h.hexdigest()
+        self._pipeline_digest_cache[key] = (signature, digest)
+        return digest
+
+    def _calculate_input_signature(self, context: Dict, link_id: str, link_path: str, link_config: Dict,
+                                   algo: Optional[str] = None) -> str:
         """
         Calculate input signature for skip decisions.
         
@@ -1303,46 +1892,157 @@ class Orchestrator:
         Must include:
         - Link config (so config changes force re-run)
         - Bundle SHA (so input changes force re-run of dependent links)
+
+        algo defaults to DAWN_SIGNATURE_ALGO; it is passed to re-sign with the
+        algorithm a previous ledger event recorded.
         """
-        sig_parts = []
-        
-        # 1. Link identifier
-        sig_parts.append(f"link={link_id}")
-        
-        # 2. Config hash (forces re-run on config change)
         config_data = link_config.get("config", {})
-        config_json = json.dumps(config_data, sort_keys=True)
-        config_hash = hashlib.sha256(config_json.encode()).hexdigest()[:16]
-        sig_parts.append(f"cfg={config_hash}")
-        
-        # 3. Bundle SHA (forces re-run when inputs change)
+
+        # Bundle SHA (forces re-run when inputs change)
+        bundle_sha = None
         try:
             bundle_meta = context["artifact_store"].get("dawn.project.bundle")
-            if bundle_meta and Path(bundle_meta["path"]).exists():
-                with open(bundle_meta["path"]) as f:
-                    bundle_data = json.load(f)
-                    bundle_sha = bundle_data.get("bundle_sha256")
-                    if bundle_sha:
-                        sig_parts.append(f"bundle={bundle_sha}")
+            if bundle_meta:
+                bundle_sha = self._run_bundle_sha(context, bundle_meta)
         except Exception:
             pass  # Bundle not available - skip this part
-        
-        # Combine and hash
-        combined = "|".join(sig_parts)
-        return hashlib.sha256(combined.encode()).hexdigest()[:32]
-
-    def _get_fs_snapshot(self, root_dir: str) -> Dict[str, float]:
-        """Returns a mapping of relative file paths to their modification times."""
-        snapshot = {}
-        root = Path(root_dir)
-        for p in root.rglob("*"):
-            if p.is_file():
+
+        if (algo or self._signature_algo) == "sha256":
+            # Legacy layout: link id, config hash and bundle SHA joined into one string
+            sig_parts = [f"link={link_id}"]
+            config_hash = hashlib.sha256()
+            _hash_json(config_hash, config_data, _LEGACY_CANONICAL_ENCODER)
+            sig_parts.append(f"cfg={config_hash.hexdigest()[:16]}")
+            if bundle_sha:
+                sig_parts.append(f"bundle={bundle_sha}")
+            return hashlib.sha256("|".join(sig_parts).encode()).hexdigest()[:32]
+
+        # Fields are fed to the hasher as they are encoded, each behind a
+        # unit separator so adjacent fields cannot run together
+        h = hashlib.blake2b(digest_size=16)
+        h.update(b"link\x1f")
+        h.update(link_id.encode())
+        h.update(b"\x1fcfg\x1f")
+        _hash_json(h, config_data)
+        if bundle_sha:
+            h.update(b"\x1fbundle\x1f")
+            h.update(str(bundle_sha).encode())
+        return h.hexdigest()
+
+    def _run_bundle_sha(self, context: Dict, bundle_meta: Dict) -> Optional[str]:
+        """
+        bundle_sha256 of the run's registered bundle, looked up once per registration.
+
+        Memoized on the context against the registered digest, so later links
+        skip even the stat; re-publishing the bundle registers a new digest.
+        """
+        digest = bundle_meta.get("digest")
+        cached = context.get("_bundle_sha")
+        if digest and cached is not None and cached[0] == (bundle_meta["path"], digest):
+            return cached[1]
+        bundle_sha = self._bundle_sha(bundle_meta["path"])
+        if digest:
+            context["_bundle_sha"] = ((bundle_meta["path"], digest), bundle_sha)
+        return bundle_sha
+
+    def _bundle_sha(self, bundle_path: str) -> Optional[str]:
+        """bundle_sha256 recorded in a project bundle, re-read only when the file changes."""
+        key, signature = self._stat_key(bundle_path)
+        cached = self._bundle_sha_cache.get(key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, json_loads(read_bytes(bundle_path)).get("bundle_sha256"))
+            self._bundle_sha_cache[key] = cached
+        return cached[1]
+
+    def _get_fs_snapshot(self, root_dir: str) -> Tuple[List[str], array]:
+        """
+        Returns (sorted relative file paths, their st_mtime_ns in the same order).
+
+        Top-level runs/ and ledger/ are skipped; the sandbox check ignores them.
+        Directory listings come from _list_dir, so unchanged directories are
+        not re-read; every file is still stat'ed, since in-place writes do not
+        touch the directory's mtime.
+        """
+        paths: List[str] = []
+        mtimes = array("q")
+        root = os.fspath(root_dir)
+        # path is root + sep + relative path
+        prefix_len = len(os.path.join(root, ""))
+        scan_started_ns = time.time_ns()
+        try:
+            stack = [(root, os.stat(root).st_mtime_ns)]
+        except OSError:
+            return paths, mtimes
+        while stack:
+            current, dir_mtime_ns = stack.pop()
+            listing = self._list_dir(current, dir_mtime_ns, scan_started_ns)
+            if listing is None:
+                continue
+            subdirs, files = listing
+            top_level = current is root
+            for name in subdirs:
+                if top_level and name in _SANDBOX_UNWATCHED_DIRS:
+                    continue
+                path = os.path.join(current, name)
                 try:
-                    rel_path = str(p.relative_to(root))
-                    snapshot[rel_path] = p.stat().st_mtime
+                    stack.append((path, os.lstat(path).st_mtime_ns))
                 except OSError:
                     pass
-        return snapshot
+            for name in files:
+                path = os.path.join(current, name)
+                try:
+                    mtimes.append(os.stat(path).st_mtime_ns)
+                except OSError:
+                    continue
+                paths.append(path[prefix_len:])
+        order = sorted(range(len(paths)), key=paths.__getitem__)
+        return [paths[i] for i in order], array("q", [mtimes[i] for i in order])
+
+    def _list_dir(self, path: str, mtime_ns: int, scan_started_ns: int) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        (subdirectory names, file names) of path, or None if it cannot be listed.
+
+        Listings are reused while the directory's mtime is unchanged. Directories
+        modified within _LISTING_RACY_NS of the scan are re-read every time, as a
+        change in the same timestamp tick would not move the mtime.
+        """
+        cached = self._listing_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        subdirs: List[str] = []
+        files: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        pass
+        except OSError:
+            self._listing_cache.pop(path, None)
+            return None
+        if scan_started_ns - mtime_ns > _LISTING_RACY_NS:
+            self._listing_cache[path] = (mtime_ns, subdirs, files)
+        else:
+            self._listing_cache.pop(path, None)
+        return subdirs, files
+
+    @staticmethod
+    def _diff_fs_snapshots(before: Tuple[List[str], array], after: Tuple[List[str], array]) -> List[str]:
+        """Paths of after that are new or have a different mtime, by one merge walk over both snapshots."""
+        before_paths, before_mtimes = before
+        after_paths, after_mtimes = after
+        changed = []
+        i, n = 0, len(before_paths)
+        for path, mtime in zip(after_paths, after_mtimes):
+            while i < n and before_paths[i] < path:
+                i += 1
+            if i == n or before_paths[i] != path or before_mtimes[i] != mtime:
+                changed.append(path)
+        return changed
 
     def _check_coherence(self, context: Dict, link_id: str, outputs: Dict, coherence_policy: Dict) -> Optional[float]:
         """Calculates coherence score and logs drift if necessary."""
@@ -1444,7 +2144,7 @@ class Orchestrator:
         
         maturity = {"consecutive_wins": 0, "consecutive_parity": 0, "history": []}
         if maturity_file.exists():
-            with open(maturity_file, "r") as f: maturity = json.load(f)
+            maturity = json_loads(read_bytes(maturity_file))
             
         # Update maturity based on variance and scores
         # Logic: If variance is 0, it's parity. If coherence is better, it's a win.
@@ -1462,8 +2162,7 @@ class Orchestrator:
             "status": status
         })
         
-        with open(maturity_file, "w") as f:
-            json.dump(maturity, f, indent=2)
+        write_bytes_atomic(maturity_file, json_dumps(maturity))
 
         # 4. Check for Promotion Criteria (Maturity Window)
         promotion_policy = self.runtime_policy.get("promotion_policy", {"maturity_window": 3})
@@ -1495,7 +2194,7 @@ class Orchestrator:
         
         maturity = {"consecutive_success": 0, "history": []}
         if maturity_file.exists():
-            with open(maturity_file, "r") as f: maturity = json.load(f)
+            maturity = json_loads(read_bytes(maturity_file))
             
         # Ensure 'consecutive_success' exists
         if "consecutive_success" not in maturity:
@@ -1515,8 +2214,7 @@ class Orchestrator:
             "status": status
         })
         
-        with open(maturity_file, "w") as f:
-            json.dump(maturity, f, indent=2)
+        write_bytes_atomic(maturity_file, json_dumps(maturity))
             
         print(f"Shadow run complete. Maturity: {maturity['consecutive_success']}/{window}")
         
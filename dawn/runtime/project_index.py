@@ -6,6 +6,17 @@ import hashlib
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+# Last formatted second for utc_timestamp(): [epoch second, ISO string]
+_TIMESTAMP_CACHE: List[Any] = [None, ""]
+
+def utc_timestamp() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ, formatted at most once per second."""
+    now = int(time.time())
+    cached = _TIMESTAMP_CACHE
+    if cached[0] != now:
+        cached[:] = [now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))]
+    return cached[1]
+
 def calculate_sha256(file_path: Path) -> str:
     """Calculate SHA256 digest of a file."""
     sha256_hash = hashlib.sha256()
@@ -59,9 +70,9 @@ def update_project_index(project_root: Path, pipeline_meta: Optional[Dict] = Non
                     warnings.append(f"Failed to load config/project.json: {e}")
         
         if not index.get("created_at"):
-            index["created_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            index["created_at"] = utc_timestamp()
         
-        index["last_updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        index["last_updated_at"] = utc_timestamp()
 
         # 4. Pipeline Metadata
         if pipeline_meta:
@@ -94,7 +105,7 @@ def update_project_index(project_root: Path, pipeline_meta: Optional[Dict] = Non
             if not current_run and run_id:
                 current_run = {
                     "run_id": run_id,
-                    "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "started_at": utc_timestamp(),
                     "executor": pipeline_meta.get("executor") if pipeline_meta else None,
                     "profile": pipeline_meta.get("profile") if pipeline_meta else None,
                     "run_dir": f"runs/{run_id}",
@@ -106,7 +117,7 @@ def update_project_index(project_root: Path, pipeline_meta: Optional[Dict] = Non
                 if status:
                     current_run["status"] = status
                 if status in ["SUCCEEDED", "FAILED"]:
-                    current_run["ended_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                    current_run["ended_at"] = utc_timestamp()
                     if run_context.get("error"):
                         current_run["error"] = run_context["error"]
 
@@ -252,7 +263,7 @@ def update_project_index(project_root: Path, pipeline_meta: Optional[Dict] = Non
                                 "decision": data.get("decision"),
                                 "written_path": str(p.relative_to(project_root)),
                                 "written_digest_sha256": calculate_sha256(p),
-                                "timestamp": data.get("timestamp", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+                                "timestamp": data.get("timestamp", utc_timestamp()),
                                 "comment": data.get("reason", "")
                             })
                     except: pass
@@ -0,0 +1,102 @@
+"""Project run lock: fcntl.flock on POSIX, woken by inotify instead of polling while waiting."""
+import contextlib
+import os
+import select
+import time
+from typing import Iterator, Optional, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows: fall back to filelock
+    FCNTL_AVAILABLE = False
+
+# Optional inotify_simple: wait for the holder's close instead of polling
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+# Retry interval while waiting without inotify
+POLL_INTERVAL = 0.05
+
+
+class LockTimeout(Exception):
+    """Raised when the lock is still held by someone else after the timeout."""
+    pass
+
+
+@contextlib.contextmanager
+def acquire(lock_path: Union[str, os.PathLike], timeout: Optional[float] = None) -> Iterator[None]:
+    """
+    Hold an exclusive lock on lock_path for the duration of the with block.
+
+    timeout=0 makes a single attempt and None waits indefinitely. Raises
+    LockTimeout if the lock could not be taken in time. On POSIX this is a
+    plain flock, so it interoperates with filelock.FileLock on the same path.
+    """
+    if not FCNTL_AVAILABLE:
+        from filelock import FileLock, Timeout
+        lock = FileLock(lock_path, timeout=-1 if timeout is None else timeout)
+        try:
+            lock.acquire()
+        except Timeout:
+            raise LockTimeout(f"Lock busy: {lock_path}")
+        try:
+            yield
+        finally:
+            lock.release()
+        return
+
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        if not _try_flock(fd):
+            _wait_for_lock(fd, lock_path, timeout)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _try_flock(fd: int) -> bool:
+    """One non-blocking attempt at the exclusive lock."""
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+def _wait_for_lock(fd: int, lock_path: Union[str, os.PathLike], timeout: Optional[float]):
+    """Retry the flock until it succeeds or timeout expires."""
+    if timeout == 0:
+        raise LockTimeout(f"Lock busy: {lock_path}")
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def remaining() -> Optional[float]:
+        if deadline is None:
+            return None
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise LockTimeout(f"Lock busy: {lock_path}")
+        return left
+
+    if INOTIFY_AVAILABLE:
+        # The holder's close (or the file's removal) wakes us; other events
+        # in the directory just cause a harmless extra attempt.
+        with INotify() as inotify:
+            parent = os.path.dirname(os.path.abspath(lock_path))
+            inotify.add_watch(parent, inotify_flags.CLOSE_WRITE | inotify_flags.DELETE
+                              | inotify_flags.MOVED_FROM)
+            while not _try_flock(fd):
+                ready, _, _ = select.select([inotify.fileno()], [], [], remaining())
+                if ready:
+                    inotify.read(timeout=0)
+        return
+
+    while not _try_flock(fd):
+        left = remaining()
+        time.sleep(POLL_INTERVAL if left is None else min(POLL_INTERVAL, left))
@@ -133,6 +133,13 @@ class ArtifactPruner:
         # Prune empty link directories in artifacts/
         if not dry_run:
             self._cleanup_empty_dirs(project_root / "artifacts")
+            if report.deleted:
+                # The orchestrator's incremental size total is stale now;
+                # the next run re-measures the project
+                try:
+                    (project_root / "project_size.json").unlink()
+                except FileNotFoundError:
+                    pass
 
         return report
 
@@ -1,18 +1,54 @@
 """Discovers and indexes link metadata from link.yaml files across one or more links directories."""
 import os
 import yaml
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+@dataclass(slots=True)
+class LinkSpec:
+    """The link.yaml fields the orchestrator reads on every execution, pre-resolved."""
+    always_run: bool
+    requires: list
+    produces: list
+    when_condition: str
+    max_wall_time_sec: Optional[int]
+    contract_version: str
+    coherence_policy: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_config(cls, link_config: Dict[str, Any]) -> "LinkSpec":
+        """Build a spec from a (possibly overridden) link.yaml dict."""
+        spec = link_config.get("spec", {})
+        runtime = spec.get("runtime", {})
+        return cls(
+            always_run=bool(
+                spec.get("always_run", False) or
+                spec.get("alwaysRun", False) or
+                runtime.get("always_run", False) or
+                runtime.get("alwaysRun", False)
+            ),
+            requires=spec.get("requires", []),
+            produces=spec.get("produces", []),
+            when_condition=spec.get("when", {}).get("condition", "always"),
+            max_wall_time_sec=link_config.get("max_wall_time_sec"),
+            contract_version=link_config.get("contractVersion", "1.0.0"),
+            coherence_policy=spec.get("coherence_policy"),
+        )
+
 class Registry:
     def __init__(self, links_dirs: List[str]):
         """ init ."""
         self.links_dirs = [Path(d) for d in links_dirs]
         self.links: Dict[str, Dict[str, Any]] = {}
+        # Memoized LinkSpec per link ID with the metadata dict it was built from;
+        # dropped whenever that metadata changes in place
+        self._specs: Dict[str, tuple] = {}
 
     def discover_links(self):
         """Discover links."""
         self.links = {}
+        self._specs = {}
         for d in self.links_dirs:
             if not d.exists():
                 continue
@@ -34,6 +70,22 @@ class Registry:
         """Get link."""
         return self.links.get(link_id)
 
+    def get_link_spec(self, link_id: str) -> Optional[LinkSpec]:
+        """LinkSpec for a discovered link, computed on first use."""
+        link = self.links.get(link_id)
+        if link is None:
+            return None
+        cached = self._specs.get(link_id)
+        if cached is not None and cached[0] is link["metadata"]:
+            return cached[1]
+        spec = LinkSpec.from_config(link["metadata"])
+        self._specs[link_id] = (link["metadata"], spec)
+        return spec
+
+    def invalidate_link_spec(self, link_id: str):
+        """Forget the memoized spec after the link's metadata was modified in place."""
+        self._specs.pop(link_id, None)
+
     def list_links(self) -> List[str]:
         """List links."""
         return list(self.links.keys())
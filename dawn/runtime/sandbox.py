@@ -56,27 +56,26 @@ class Sandbox:
         """
         path = self.write_json(filename, obj)
         if self.artifact_store:
-            self.artifact_store.register(
-                artifact_id=artifact,
-                abs_path=str(Path(path).absolute()),
-                schema=schema,
-                producer_link_id=self.link_id,
-                blob_uri=blob_uri,
-                is_shadow=self.is_shadow
-            )
+            self._register(artifact, path, schema, blob_uri)
         return path
 
     def publish_text(self, artifact: str, filename: str, text: str, schema: str = "text", blob_uri: Optional[str] = None):
         """Publish text artifact and register."""
         path = self.write_text(filename, text)
         if self.artifact_store:
-            self.artifact_store.register(
-                artifact_id=artifact,
-                abs_path=str(Path(path).absolute()),
-                schema=schema,
-                producer_link_id=self.link_id,
-                blob_uri=blob_uri,
-                is_shadow=self.is_shadow
-            )
+            self._register(artifact, path, schema, blob_uri)
         return path
 
+    def _register(self, artifact: str, path: str, schema: str, blob_uri: Optional[str]):
+        """Register a published file and journal it to the link's manifest."""
+        self.artifact_store.register(
+            artifact_id=artifact,
+            abs_path=str(Path(path).absolute()),
+            schema=schema,
+            producer_link_id=self.link_id,
+            blob_uri=blob_uri,
+            is_shadow=self.is_shadow
+        )
+        meta = self.artifact_store.get(artifact, include_shadow=self.is_shadow)
+        self.artifact_store.append_manifest_record(artifact, meta, self.link_id, is_shadow=self.is_shadow)
+
@@ -0,0 +1,280 @@
+"""
+DAWN Concurrent Execution Tests
+
+Run with: python3 -m dawn.runtime.test_concurrency
+
+Tests:
+- Fan-out pipeline: independent links run concurrently and all succeed
+- Parallel failure: nothing starts after a failed link, as in a serial run
+- Worker daemon: frame protocol round trip and truncation
+- Worker pool: concurrent runs get separate workers; a dying worker is replaced
+- Project lock: a second process waits and takes the lock once it is released
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def test_parallel_fan_out():
+    """Test: Independent links share one artifact store concurrently."""
+    print("\n[TEST] Parallel fan-out pipeline")
+    print("-" * 50)
+
+    from dawn.runtime.orchestrator import Orchestrator
+    from dawn.policy import get_policy_loader, reset_policy_loader
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        projects_dir = Path(tmpdir) / "projects"
+        projects_dir.mkdir()
+
+        reset_policy_loader()
+        loader = get_policy_loader()
+        loader.policy["budgets"]["per_project"]["max_parallel_links"] = 4
+        orchestrator = Orchestrator(
+            links_dir=str(PROJECT_ROOT / "dawn" / "links"),
+            projects_dir=str(projects_dir)
+        )
+
+        fan_out = ["test.branch", "test.branch_a", "test.branch_b", "test.dummy", "test.smoke"]
+        pipeline = projects_dir / "fan_out.yaml"
+        pipeline.write_text("pipelineId: fan_out_test\nlinks:\n" + "".join(f"  - id: {l}\n" for l in fan_out))
+
+        for attempt in range(10):
+            project_id = f"test_fan_out_{attempt}"
+            context = orchestrator.run_pipeline(project_id, str(pipeline))
+            statuses = {l: context["status_index"].get(l) for l in fan_out}
+            assert set(statuses.values()) == {"SUCCEEDED"}, f"Fan-out run failed: {statuses}"
+
+            events_file = projects_dir / project_id / "ledger" / "events.jsonl"
+            events = [json.loads(line) for line in events_file.read_text().splitlines() if line]
+            completed = {e["link_id"] for e in events
+                         if e["step_id"] == "link_complete" and e["status"] == "SUCCEEDED"}
+            assert completed == set(fan_out), f"Links did not all succeed: {sorted(completed)}"
+
+        reset_policy_loader()
+        print(f"  ✓ {len(fan_out)} independent links succeeded in 10 concurrent runs")
+        print("  PASSED\n")
+        return True
+
+
+def test_parallel_failure_stops():
+    """Test: A failure under parallel scheduling stops the pipeline like a serial run."""
+    print("\n[TEST] Parallel failure stop semantics")
+    print("-" * 50)
+
+    from dawn.runtime.orchestrator import Orchestrator
+    from dawn.policy import get_policy_loader, reset_policy_loader
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        projects_dir = Path(tmpdir) / "projects"
+        projects_dir.mkdir()
+
+        pipeline = projects_dir / "fail_fast.yaml"
+        pipeline.write_text(
+            "pipelineId: fail_fast_test\n"
+            "links:\n"
+            "  - id: test.missing_id\n"
+            "  - id: test.dummy\n"
+            "    config:\n"
+            "      sleep_sec: 1\n"
+            "  - id: test.branch_a\n"
+            "  - id: test.branch_b\n"
+            "  - id: test.smoke\n"
+        )
+
+        # With 2 slots, test.missing_id fails at once while test.dummy is still
+        # asleep, so the queued links could only start by ignoring the failure
+        started, errors = {}, {}
+        for max_parallel in (1, 2):
+            reset_policy_loader()
+            loader = get_policy_loader()
+            loader.policy["budgets"]["per_project"]["max_parallel_links"] = max_parallel
+            orchestrator = Orchestrator(
+                links_dir=str(PROJECT_ROOT / "dawn" / "links"),
+                projects_dir=str(projects_dir)
+            )
+            project_id = f"test_fail_fast_{max_parallel}"
+            try:
+                orchestrator.run_pipeline(project_id, str(pipeline))
+                raise AssertionError(f"Pipeline with a failing link succeeded (max_parallel_links={max_parallel})")
+            except RuntimeError as e:
+                errors[max_parallel] = str(e)
+
+            events_file = projects_dir / project_id / "ledger" / "events.jsonl"
+            events = [json.loads(line) for line in events_file.read_text().splitlines() if line]
+            started[max_parallel] = {e["link_id"] for e in events
+                                     if e["step_id"] == "link_start" and e["link_id"].startswith("test.")}
+
+        reset_policy_loader()
+        assert "Pipeline failed at link test.missing_id" in errors[1], f"Unexpected failure: {errors[1]}"
+        assert errors[2] == errors[1], f"Parallel run failed differently: {errors[2]}"
+        print("  ✓ Serial and parallel runs fail at test.missing_id with the same error")
+
+        assert started[1] == {"test.missing_id"}, f"Serial run started links after the failure: {started[1]}"
+        assert started[2] == {"test.missing_id", "test.dummy"}, \
+            f"Parallel run started queued links after the failure: {started[2]}"
+        print("  ✓ Queued links never start once a link has failed")
+        print("  PASSED\n")
+        return True
+
+
+def test_worker_frames():
+    """Test: Length-prefixed worker frames round-trip and reject truncation."""
+    print("\n[TEST] Worker frame protocol")
+    print("-" * 50)
+
+    from dawn.runtime.worker_daemon import recv_frame, send_frame
+
+    stream = io.BytesIO()
+    send_frame(stream, {"project_id": "p", "exit_code": 0})
+    send_frame(stream, [])
+    stream.seek(0)
+    assert recv_frame(stream) == {"project_id": "p", "exit_code": 0}
+    assert recv_frame(stream) == []
+    assert recv_frame(stream) is None, "Expected None at end of stream"
+    print("  ✓ Frames round-trip; clean EOF reads as None")
+
+    for cut in (2, 6):
+        try:
+            recv_frame(io.BytesIO(stream.getvalue()[:cut]))
+        except EOFError:
+            continue
+        raise AssertionError(f"Frame truncated at {cut} bytes was accepted")
+    print("  ✓ Truncated header and payload raise EOFError")
+    print("  PASSED\n")
+    return True
+
+
+def test_worker_pool():
+    """Test: Busy workers are not shared and a dead worker fails only its own run."""
+    print("\n[TEST] Worker pool")
+    print("-" * 50)
+
+    from dawn.runtime.executors import subprocess as sub
+
+    original_cmd = sub._WORKER_CMD
+    try:
+        # Stand-in daemon that echoes an exit code, or dies on a "die" request
+        sub._WORKER_CMD = [sys.executable, "-c", (
+            "import sys; from dawn.runtime.worker_daemon import recv_frame, send_frame\n"
+            "while True:\n"
+            "    r = recv_frame(sys.stdin.buffer)\n"
+            "    if r is None or r['project_id'] == 'die': break\n"
+            "    send_frame(sys.stdout.buffer, {'exit_code': 0})\n"
+        )]
+        executor = sub.SubprocessExecutor()
+        log_path = Path(tempfile.gettempdir()) / "worker.log"
+
+        first, second = sub._checkout_worker(), sub._checkout_worker()
+        assert first is not second, "Concurrent runs shared one worker"
+        sub._checkin_worker(first)
+        sub._checkin_worker(second)
+        print("  ✓ A busy worker is not handed to a second run")
+
+        assert executor._run_in_worker("ok", "p.yaml", None, log_path) == 0
+        try:
+            executor._run_in_worker("die", "p.yaml", None, log_path)
+            raise AssertionError("Expected the dead worker to fail the run")
+        except RuntimeError as e:
+            assert "Pipeline worker failed" in str(e)
+        assert all(w.poll() is None for w in sub._IDLE_WORKERS), "Dead worker returned to the pool"
+        assert executor._run_in_worker("ok", "p.yaml", None, log_path) == 0
+        print("  ✓ A dying worker fails its run and is replaced")
+        print("  PASSED\n")
+        return True
+    finally:
+        sub._WORKER_CMD = original_cmd
+        with sub._WORKER_LOCK:
+            idle, sub._IDLE_WORKERS[:] = list(sub._IDLE_WORKERS), []
+        for worker in idle:
+            worker.stdin.close()
+            worker.wait()
+
+
+def test_project_lock_wait():
+    """Test: A waiting process gets the project lock when the holder releases it."""
+    print("\n[TEST] Project lock wait")
+    print("-" * 50)
+
+    from dawn.runtime import project_lock
+
+    # Waiter: takes the lock (optionally forced onto the polling path) and
+    # reports how long it waited
+    waiter = (
+        "import sys, time\n"
+        "from dawn.runtime import project_lock\n"
+        "if sys.argv[2] == 'poll': project_lock.INOTIFY_AVAILABLE = False\n"
+        "start = time.monotonic()\n"
+        "try:\n"
+        "    with project_lock.acquire(sys.argv[1], timeout=float(sys.argv[3])):\n"
+        "        print(time.monotonic() - start)\n"
+        "except project_lock.LockTimeout:\n"
+        "    sys.exit(3)\n"
+    )
+    modes = ["poll"] + (["inotify"] if project_lock.INOTIFY_AVAILABLE else [])
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lock_path = os.path.join(tmpdir, ".lock")
+        for mode in modes:
+            with project_lock.acquire(lock_path, timeout=0):
+                timed_out = subprocess.run([sys.executable, "-c", waiter, lock_path, mode, "0.2"], env=env)
+                assert timed_out.returncode == 3, "Waiter took a lock that was still held"
+
+                proc = subprocess.Popen([sys.executable, "-c", waiter, lock_path, mode, "30"],
+                                        env=env, stdout=subprocess.PIPE, text=True)
+                time.sleep(1.0)
+                assert proc.poll() is None, "Waiter did not block on the held lock"
+            out, _ = proc.communicate(timeout=30)
+            assert proc.returncode == 0, f"Waiter failed ({mode})"
+            assert float(out) >= 0.9, f"Waiter got the lock after {out.strip()}s while it was held"
+            print(f"  ✓ {mode}: times out while held, acquires after release")
+
+    print("  PASSED\n")
+    return True
+
+
+def run_all_tests():
+    """Run all concurrency tests."""
+    print("\n" + "=" * 60)
+    print(" DAWN Concurrent Execution Tests")
+    print("=" * 60)
+
+    results = {}
+    results["parallel_fan_out"] = test_parallel_fan_out()
+    results["parallel_failure_stops"] = test_parallel_failure_stops()
+    results["worker_frames"] = test_worker_frames()
+    results["worker_pool"] = test_worker_pool()
+    results["project_lock_wait"] = test_project_lock_wait()
+
+    # Summary
+    print("\n" + "=" * 60)
+    print(" Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for v in results.values() if v)
+    total = len(results)
+
+    for name, passed_test in results.items():
+        status = "✓ PASS" if passed_test else "✗ FAIL"
+        print(f"  {status}: {name}")
+
+    print(f"\n  Total: {passed}/{total} tests passed")
+    print("=" * 60 + "\n")
+
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
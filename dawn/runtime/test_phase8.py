@@ -9,6 +9,7 @@ Tests:
 - Phase 8.3.2: BUDGET_TIMEOUT
 - Phase 8.3.3: BUDGET_OUTPUT_LIMIT
 - Phase 8.4.1: worker_id and run_id in ledger
+- Phase 8.4.1: Legacy sha256 input signatures stay ALREADY_DONE
 - Phase 8.4.2: dawn.metrics.run_summary artifact
 - Phase 8.4.3: Queue telemetry
 - Phase 8.5.1: --profile CLI switch
@@ -32,7 +33,18 @@ def test_deliverable_0_policy_loader():
     print("\n[TEST] Deliverable 0: Policy Loader")
     print("-" * 50)
 
-    from dawn.policy import get_policy_loader, reset_policy_loader
+    from dawn.policy import PolicyLoader, get_policy_loader, reset_policy_loader
+
+    unloaded = PolicyLoader()
+    for accessor in (lambda: unloaded.get_budget("per_link", "max_wall_time_sec"),
+                     lambda: unloaded.get_security("allow_src_writes"),
+                     unloaded.get_retry_config, unloaded.get_retention_config,
+                     unloaded.get_protected_artifacts):
+        try:
+            accessor()
+            raise AssertionError("Accessor on an unloaded policy did not raise")
+        except RuntimeError as e:
+            assert "Policy not loaded" in str(e)
 
     reset_policy_loader()
     loader = get_policy_loader()
@@ -46,6 +58,49 @@ def test_deliverable_0_policy_loader():
     print("  ✓ Policy version: 2.0.0")
     print(f"  ✓ Policy digest: {loader.digest[:16]}...")
     print("  ✓ Budgets loaded correctly")
+    print("  ✓ Accessors fail fast before load()")
+    print("  PASSED\n")
+    return True
+
+
+def test_deliverable_0_policy_cache():
+    """Test: Cached policy is invalidated when the file changes."""
+    print("\n[TEST] Deliverable 0: Policy Cache")
+    print("-" * 50)
+
+    from dawn.policy import PolicyLoader, get_policy_loader, reset_policy_loader
+
+    reset_policy_loader()
+    source = Path(PROJECT_ROOT) / "dawn" / "policy" / "runtime_policy.yaml"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        policy_path = Path(tmpdir) / "runtime_policy.yaml"
+        shutil.copy(source, policy_path)
+
+        first = PolicyLoader(policy_path)
+        first.load()
+        first.policy["default_profile"] = "mutated"
+
+        second = PolicyLoader(policy_path)
+        second.load()
+        assert second.digest == first.digest
+        assert second.policy["default_profile"] == "normal", "Cache leaked a mutation"
+        print("  ✓ Cache hit returns an isolated policy copy")
+
+        shared = get_policy_loader(policy_path)
+        shared.policy["budgets"]["per_link"]["max_wall_time_sec"] = 1
+        assert get_policy_loader(policy_path).get_budget("per_link", "max_wall_time_sec") == 60, \
+            "Explicit-path loader leaked a mutation to the next caller"
+        print("  ✓ Explicit-path loaders do not share mutations")
+
+        policy_path.write_text(policy_path.read_text() + "\nextra_key: 1\n")
+        third = PolicyLoader(policy_path)
+        third.load()
+        assert third.digest != first.digest, "Stale digest served after edit"
+        assert third.policy["extra_key"] == 1
+        print("  ✓ Edited policy invalidates the cache")
+
+    reset_policy_loader()
     print("  PASSED\n")
     return True
 
@@ -105,6 +160,58 @@ def test_phase_8_3_1_project_size_budget():
             loader.policy["budgets"]["per_project"]["max_project_bytes"] = original_limit
 
 
+def test_phase_8_3_1_project_size_recovers():
+    """Test: A recorded over-budget size does not outlive the deleted files."""
+    print("\n[TEST] Phase 8.3.1: BUDGET_PROJECT_LIMIT recovery")
+    print("-" * 50)
+
+    from dawn.runtime.orchestrator import Orchestrator, PROJECT_SIZE_FILENAME, PROJECT_SIZE_VERSION
+    from dawn.runtime.ledger import Ledger
+    from dawn.policy import get_policy_loader, reset_policy_loader
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        projects_dir = Path(tmpdir) / "projects"
+        project_dir = projects_dir / "test_budget_recovery"
+        project_dir.mkdir(parents=True)
+
+        reset_policy_loader()
+        loader = get_policy_loader()
+        original_limit = loader.policy["budgets"]["per_project"]["max_project_bytes"]
+        loader.policy["budgets"]["per_project"]["max_project_bytes"] = 10000
+
+        try:
+            orchestrator = Orchestrator(
+                links_dir=str(PROJECT_ROOT / "dawn" / "links"),
+                projects_dir=str(projects_dir)
+            )
+            ledger = Ledger(str(project_dir))
+
+            def check():
+                return orchestrator._check_project_size_budget(
+                    project_dir, ledger, "test_budget_recovery", "p", "run"
+                )
+
+            # Size recorded by an earlier run, before the files were deleted
+            (project_dir / PROJECT_SIZE_FILENAME).write_text(json.dumps(
+                {"version": PROJECT_SIZE_VERSION, "size_bytes": 50000, "epoch": 0}
+            ))
+            for _ in range(3):
+                error = check()
+                assert error is None, f"Stale project size still enforced: {error}"
+            print("  ✓ Stale over-budget size re-measured before failing")
+
+            large_file = project_dir / "large_input.bin"
+            large_file.write_bytes(b"X" * 50000)
+            assert "BUDGET_PROJECT_LIMIT" in (check() or ""), "Expected BUDGET_PROJECT_LIMIT"
+            large_file.unlink()
+            assert check() is None, "Budget still exceeded after deleting the file"
+            print("  ✓ Deleting files clears BUDGET_PROJECT_LIMIT")
+            print("  PASSED\n")
+            return True
+        finally:
+            loader.policy["budgets"]["per_project"]["max_project_bytes"] = original_limit
+
+
 def test_phase_8_3_2_timeout():
     """Test: BUDGET_TIMEOUT enforcement."""
     print("\n[TEST] Phase 8.3.2: BUDGET_TIMEOUT")
@@ -227,6 +334,56 @@ links:
             return False
 
 
+def test_phase_8_4_1_legacy_signature():
+    """Test: sha256 signatures in an existing ledger still match under blake2b."""
+    print("\n[TEST] Phase 8.4.1: Legacy input signatures")
+    print("-" * 50)
+
+    from dawn.runtime.orchestrator import Orchestrator
+    from dawn.policy import reset_policy_loader
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        projects_dir = Path(tmpdir) / "projects"
+        projects_dir.mkdir()
+        pipeline = projects_dir / "signature.yaml"
+        pipeline.write_text("pipelineId: signature_test\nlinks:\n  - id: test.dummy\n")
+
+        reset_policy_loader()
+        original_algo = os.environ.get("DAWN_SIGNATURE_ALGO")
+        os.environ["DAWN_SIGNATURE_ALGO"] = "sha256"
+        try:
+            Orchestrator(links_dir=str(PROJECT_ROOT / "dawn" / "links"),
+                         projects_dir=str(projects_dir)).run_pipeline("test_signature", str(pipeline))
+        finally:
+            if original_algo is None:
+                os.environ.pop("DAWN_SIGNATURE_ALGO", None)
+            else:
+                os.environ["DAWN_SIGNATURE_ALGO"] = original_algo
+
+        # Rewrite the ledger as a pre-signature_algo release would have left it
+        ledger_file = projects_dir / "test_signature" / "ledger" / "events.jsonl"
+        events = [json.loads(line) for line in ledger_file.read_text().splitlines() if line]
+        for event in events:
+            event.get("metrics", {}).pop("signature_algo", None)
+        ledger_file.write_text("".join(json.dumps(e) + "\n" for e in events))
+
+        orchestrator = Orchestrator(links_dir=str(PROJECT_ROOT / "dawn" / "links"),
+                                    projects_dir=str(projects_dir))
+        assert orchestrator._signature_algo == "blake2b"
+        context = orchestrator.run_pipeline("test_signature", str(pipeline))
+        assert context["status_index"]["test.dummy"] == "SKIPPED", \
+            f"Legacy signature did not match: {context['status_index']['test.dummy']}"
+        print("  ✓ Link signed with sha256 is ALREADY_DONE under blake2b")
+
+        pipeline.write_text(pipeline.read_text() + "    config:\n      sleep_sec: 0.01\n")
+        context = orchestrator.run_pipeline("test_signature", str(pipeline))
+        assert context["status_index"]["test.dummy"] == "SUCCEEDED", "Config change did not force a re-run"
+        print("  ✓ Config change still forces a re-run")
+
+    print("  PASSED\n")
+    return True
+
+
 def test_phase_8_4_2_run_summary():
     """Test: dawn.metrics.run_summary artifact generation."""
     print("\n[TEST] Phase 8.4.2: dawn.metrics.run_summary artifact")
@@ -328,6 +485,63 @@ def test_phase_8_5_isolation_mode():
                 return False
 
 
+def test_phase_8_5_watched_sandbox():
+    """Test: The inotify watcher records writes and catches a sandbox leak."""
+    print("\n[TEST] Phase 8.5: inotify sandbox tracking")
+    print("-" * 50)
+
+    from dawn.runtime.fswatch import FsWatcher, INOTIFY_AVAILABLE
+    from dawn.runtime.orchestrator import Orchestrator
+    from dawn.policy import reset_policy_loader
+
+    if not INOTIFY_AVAILABLE:
+        print("  ⚠ inotify_simple not installed; skipped")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "watched"
+        (root / "ledger").mkdir(parents=True)
+        watcher = FsWatcher(root, skip_dirs=("ledger",))
+        try:
+            (root / "top.txt").write_text("x")
+            (root / "ledger" / "events.jsonl").write_text("x")
+            (root / "new" / "deep").mkdir(parents=True)
+            (root / "new" / "deep" / "file.txt").write_text("x")
+            changed = watcher.changed()
+            assert changed == {"top.txt", os.path.join("new", "deep", "file.txt")}, changed
+            assert watcher.changed() == set(), "changed() did not drain"
+        finally:
+            watcher.close()
+        print("  ✓ Writes recorded, new subdirectories watched, skip_dirs ignored")
+
+        projects_dir = Path(tmpdir) / "projects"
+        projects_dir.mkdir()
+        reset_policy_loader()
+        orchestrator = Orchestrator(
+            links_dir=str(PROJECT_ROOT / "dawn" / "links"),
+            projects_dir=str(projects_dir)
+        )
+        watchers = []
+
+        def start_fs_watcher(project_root):
+            watchers.append(Orchestrator._start_fs_watcher(project_root))
+            return watchers[-1]
+
+        orchestrator._start_fs_watcher = start_fs_watcher
+        try:
+            orchestrator.run_pipeline(
+                "test_watched_sandbox",
+                str(PROJECT_ROOT / "dawn" / "pipelines" / "test_policy_violation.yaml")
+            )
+            raise AssertionError("Expected POLICY_VIOLATION for a write outside the sandbox")
+        except RuntimeError as e:
+            assert "POLICY_VIOLATION" in str(e), f"Wrong error: {e}"
+        assert watchers and watchers[0] is not None, "Pipeline did not run under the watcher"
+        print("  ✓ Write outside the sandbox caught while the watcher is active")
+        print("  PASSED\n")
+        return True
+
+
 def run_all_tests():
     """Run all acceptance tests."""
     print("\n" + "=" * 60)
@@ -338,19 +552,23 @@ def run_all_tests():
 
     # Deliverable 0
     results["D0_policy_loader"] = test_deliverable_0_policy_loader()
+    results["D0_policy_cache"] = test_deliverable_0_policy_cache()
 
     # Phase 8.3
     results["8.3.1_project_size"] = test_phase_8_3_1_project_size_budget()
+    results["8.3.1_project_size_recovery"] = test_phase_8_3_1_project_size_recovers()
     results["8.3.2_timeout"] = test_phase_8_3_2_timeout()
     # Skip 8.3.3 (large output) as it's slow and disk-intensive
 
     # Phase 8.4
     results["8.4.1_worker_run_id"] = test_phase_8_4_1_worker_and_run_id()
+    results["8.4.1_legacy_signature"] = test_phase_8_4_1_legacy_signature()
     results["8.4.2_run_summary"] = test_phase_8_4_2_run_summary()
     # Skip 8.4.3 (queue telemetry) - requires queue setup
 
     # Phase 8.5
     results["8.5_isolation"] = test_phase_8_5_isolation_mode()
+    results["8.5_watched_sandbox"] = test_phase_8_5_watched_sandbox()
 
     # Summary
     print("\n" + "=" * 60)
@@ -169,11 +169,36 @@ links:
 
         # Verify
         verifier = LockfileVerifier(str(projects_dir), str(PROJECT_ROOT / "dawn" / "links"))
+        cache_path = projects_dir / LockfileGenerator.DIGEST_CACHE_FILENAME
+        cache_before = cache_path.read_bytes() if cache_path.exists() else None
         result = verifier.verify("test_lockfile")
+        cache_after = cache_path.read_bytes() if cache_path.exists() else None
+        assert cache_after == cache_before, "verify wrote the digest cache"
         # Note: Will have mismatches because we didn't run a real pipeline
         assert "verified" in result
         print("  ✓ Verification runs without error")
 
+        # Same-size pipeline edit with its mtime restored afterwards
+        pipeline_yaml = project_dir / "pipeline.yaml"
+        st = pipeline_yaml.stat()
+        pipeline_yaml.write_text(pipeline_content.replace("test_pipeline", "test_pipelinX"))
+        os.utime(pipeline_yaml, ns=(st.st_atime_ns, st.st_mtime_ns))
+        result = verifier.verify("test_lockfile")
+        assert any(m["component"] == "pipeline" for m in result["mismatches"]), \
+            "Pipeline drift hidden by the digest cache"
+        pipeline_yaml.write_text(pipeline_content)
+        print("  ✓ Verification re-hashes files with a restored mtime")
+
+        # Hand-edited copy keeping the stored digests
+        edited = json.loads(path.read_text())
+        edited["pipeline"]["digest"] = "0" * 64
+        edited_path = Path(tmpdir) / "edited.lock.json"
+        edited_path.write_text(json.dumps(edited))
+        result = verifier.compare_lockfiles(str(path), str(edited_path))
+        assert not result["identical"], "Stored digests hid a hand edit"
+        assert [d["key"] for d in result["differences"]] == ["pipeline"]
+        print("  ✓ Compare detects edits behind stale stored digests")
+
     print("  PASSED\n")
     return True
 
@@ -0,0 +1,112 @@
+"""
+Long-lived pipeline worker used by SubprocessExecutor.
+
+Reads length-prefixed JSON requests on stdin and answers each one with a
+length-prefixed JSON reply on stdout, so consecutive runs share one
+interpreter (and its imports) instead of paying startup per run. Each
+request still gets a fresh Orchestrator against the current policy and
+link registry, as a separate process per run would.
+
+Run with: python3 -m dawn.runtime.worker_daemon
+"""
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from dawn.runtime.fileio import json_dumps_compact, json_loads
+
+# Frame header: payload length as a 4-byte big-endian unsigned int
+_HEADER = struct.Struct(">I")
+
+
+def _read_exact(stream: BinaryIO, n: int) -> Optional[bytes]:
+    """Read exactly n bytes; None on EOF before the first byte."""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = stream.read(n - len(buf))
+        if not chunk:
+            if buf:
+                raise EOFError("Truncated worker frame")
+            return None
+        buf += chunk
+    return bytes(buf)
+
+
+def send_frame(stream: BinaryIO, obj: Any):
+    """Write obj as one length-prefixed JSON frame."""
+    payload = json_dumps_compact(obj)
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def recv_frame(stream: BinaryIO) -> Optional[Any]:
+    """Read one length-prefixed JSON frame; None when the peer closed the stream."""
+    header = _read_exact(stream, _HEADER.size)
+    if header is None:
+        return None
+    (length,) = _HEADER.unpack(header)
+    payload = _read_exact(stream, length) if length else b""
+    if payload is None:
+        raise EOFError("Truncated worker frame")
+    return json_loads(payload)
+
+
+def _new_orchestrator(base_dir: Path):
+    """Orchestrator for one request: policy reloaded if edited, links rediscovered."""
+    from dawn.policy import get_policy_loader
+    from dawn.runtime.orchestrator import Orchestrator
+
+    loader = get_policy_loader()
+    if loader.is_stale():
+        loader.load()
+    # Same layout as dawn.runtime.main: base_dir is the repo root
+    return Orchestrator(str(base_dir / "dawn" / "links"), str(base_dir / "projects"))
+
+
+def _run_request(base_dir: Path, request: dict, idle_stdout: int, idle_stderr: int) -> dict:
+    """Run one pipeline with stdout/stderr (fds 1 and 2) sent to the request's log file."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with open(request["log_path"], "wb") as log_file:
+        os.dup2(log_file.fileno(), 1)
+        os.dup2(log_file.fileno(), 2)
+
+    try:
+        orchestrator = _new_orchestrator(base_dir)
+        orchestrator.run_pipeline(request["project_id"], request["pipeline_path"],
+                                  profile=request.get("profile"))
+        return {"exit_code": 0, "error": None}
+    except Exception as e:
+        print(f"\nPipeline execution failed: {e}")
+        return {"exit_code": 1, "error": str(e)}
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(idle_stdout, 1)
+        os.dup2(idle_stderr, 2)
+
+
+def main():
+    """Main."""
+    # Replies go out on a private copy of stdout; fd 1 itself only ever points
+    # at a run log or /dev/null so stray prints cannot corrupt the framing.
+    channel = os.fdopen(os.dup(1), "wb")
+    idle_stdout = os.open(os.devnull, os.O_WRONLY)
+    idle_stderr = os.dup(2)
+    os.dup2(idle_stdout, 1)
+
+    # Import the runtime once, up front; this is what the worker saves per run
+    import dawn.runtime.orchestrator  # noqa: F401
+
+    base_dir = Path(__file__).parent.parent.parent
+    while True:
+        request = recv_frame(sys.stdin.buffer)
+        if request is None:
+            break
+        send_frame(channel, _run_request(base_dir, request, idle_stdout, idle_stderr))
+
+
+if __name__ == "__main__":
+    main()